@@ -474,44 +474,6 @@ class CoordinatePoint:
         return [Symbol("xy"), self.x, self.y]
 
 
-class CoordinatePointList(KiCadObject):
-    """List of X/Y coordinate points token.
-
-    The 'pts' token defines a list of X/Y coordinate points in the format:
-    (pts
-        (xy X Y)
-        ...
-        (xy X Y)
-    )
-
-    Where each xy token defines a single X and Y coordinate pair.
-    The number of points is determined by the object type.
-    """
-
-    __token_name__ = "pts"
-
-    def __init__(self, points: Optional[List["XYCoordinate"]] = None) -> None:
-        super().__init__()
-        self.points = points or []
-
-    @classmethod
-    def from_sexpr(cls, sexpr: SExpr) -> "CoordinatePointList":
-        if not sexpr:
-            return cls()
-
-        points = []
-        for item in sexpr[1:]:
-            if isinstance(item, list) and len(item) > 0 and item[0] == Symbol("xy"):
-                points.append(XYCoordinate.from_sexpr(item))
-
-        return cls(points=points)
-
-    def to_sexpr(self) -> SExpr:
-        result: SExpr = [Symbol(self.__token_name__)]
-        result.extend([point.to_sexpr() for point in self.points])
-        return result
-
-
 class StrokeType(Enum):
     """Valid stroke line styles"""
 
@@ -722,6 +684,44 @@ class KiCadObject(ABC):
         pass
 
 
+class CoordinatePointList(KiCadObject):
+    """List of X/Y coordinate points token.
+
+    The 'pts' token defines a list of X/Y coordinate points in the format:
+    (pts
+        (xy X Y)
+        ...
+        (xy X Y)
+    )
+
+    Where each xy token defines a single X and Y coordinate pair.
+    The number of points is determined by the object type.
+    """
+
+    __token_name__ = "pts"
+
+    def __init__(self, points: Optional[List["XYCoordinate"]] = None) -> None:
+        super().__init__()
+        self.points = points or []
+
+    @classmethod
+    def from_sexpr(cls, sexpr: SExpr) -> "CoordinatePointList":
+        if not sexpr:
+            return cls()
+
+        points = []
+        for item in sexpr[1:]:
+            if isinstance(item, list) and len(item) > 0 and item[0] == Symbol("xy"):
+                points.append(XYCoordinate.from_sexpr(item))
+
+        return cls(points=points)
+
+    def to_sexpr(self) -> SExpr:
+        result: SExpr = [Symbol(self.__token_name__)]
+        result.extend([point.to_sexpr() for point in self.points])
+        return result
+
+
 class PositionIdentifier(KiCadObject):
     """Position identifier token that defines positional coordinates and rotation of an object.
 
@@ -315,7 +315,7 @@ def parse_kicad_design_rules_file(file_content: str) -> KiCadDesignRules:
         return KiCadDesignRules()
 
     # Wrap content in parentheses and parse
-    content = f"({'\n'.join(lines)})"
+    content = "(" + "\n".join(lines) + ")"
 
     sexpr = str_to_sexpr(content)
     return KiCadDesignRules.from_sexpr(sexpr)
@@ -7,6 +7,7 @@ the internal sexpdata dependency. All file operations should go through this mod
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Any, Dict, TypeVar, Union, cast
 
@@ -112,11 +113,15 @@ def format_sexp(obj: Delimiters, **kwds: Any) -> str:
 
 
 # File type detection
+_ROOT_TOKEN_RE = re.compile(r"\s*\(\s*([^\s()\"]+)")
+
+
 def detect_file_type(content: str) -> str:
     """Detect KiCad file type from S-expression content
 
     Analyzes the root token of S-expression content to determine file type.
     Supports symbol libraries, boards, schematics, footprints, worksheets, and design rules.
+    Only the root token is read, the content is not parsed.
     """
     try:
         # Handle design rules which may have multiple S-expressions with comments
@@ -134,9 +139,9 @@ def detect_file_type(content: str) -> str:
                         return "design_rules"
                     break
 
-        sexpr = str_to_sexpr(content)
-        if len(sexpr) > 0:
-            root_token = str(sexpr[0])
+        match = _ROOT_TOKEN_RE.match(content)
+        if match:
+            root_token = match.group(1)
             if root_token == "kicad_symbol_lib":
                 return "symbol_library"
             elif root_token == "kicad_pcb":
@@ -212,6 +212,7 @@ from .sexpr_parser import (
     SExpr,
     SExprParser,
     SExprValue,
+    clear_sexpr_cache,
     parse_sexpr,
     sexpr_to_str,
     str_to_sexpr,
@@ -309,6 +310,7 @@ __all__ = [
     "SExprValue",
     "parse_sexpr",
     "str_to_sexpr",
+    "clear_sexpr_cache",
     "sexpr_to_str",
     # Enums
     "ClearanceType",
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import logging
+import sys
 from abc import ABC
 from dataclasses import MISSING, dataclass, fields
 from enum import Enum
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -21,18 +24,26 @@ from typing import (
     get_type_hints,
 )
 
+from .sexpdata import Symbol
 from .sexpr_parser import SExpr, SExprParser, sexpr_to_str, str_to_sexpr
 
 T = TypeVar("T", bound="KiCadObject")
 
+# Atom types written as (name value) without further checks
+_PLAIN_TYPES = (str, int, float, bool)
+
 
 @dataclass
 class ParseCursor:
     """Lightweight cursor for tracking position in S-expression."""
 
+    # One cursor is created per parsed object, so avoid a per-instance __dict__
+    __slots__ = ("sexpr", "parser", "path", "token_index")
+
     sexpr: SExpr  # Current S-expression
     parser: SExprParser  # Single parser (passed through)
     path: List[str]  # Path for debugging
+    token_index: Dict[str, List[int]]  # Token name -> child indices
 
     def enter(self, sexpr: SExpr, name: str) -> "ParseCursor":
         """Create new cursor for nested object."""
@@ -40,8 +51,33 @@ class ParseCursor:
             sexpr=sexpr,
             parser=self.parser,  # Same parser passed through
             path=self.path + [name],
+            token_index={},
         )
 
+    def index_tokens(self) -> None:
+        """Map token names of all nested lists to their indices in one pass.
+
+        Field parsers look up their token here instead of rescanning all
+        children, so parsing an object is O(fields + children) rather than
+        O(fields * children).
+        """
+        token_index: Dict[str, List[int]] = {}
+        for i, item in enumerate(self.sexpr):
+            if i and isinstance(item, list) and item:
+                head = item[0]
+                # Read the interned name of symbols directly, str() is slower
+                key = head._s if isinstance(head, Symbol) else str(head)
+                positions = token_index.get(key)
+                if positions is None:
+                    token_index[key] = [i]
+                else:
+                    positions.append(i)
+        self.token_index = token_index
+
+    def find_tokens(self, token_name: str) -> List[int]:
+        """Indices of all nested lists starting with the given token name."""
+        return self.token_index.get(token_name, [])
+
     def get_path_str(self) -> str:
         return " > ".join(self.path)
 
@@ -77,6 +113,27 @@ class FieldInfo:
     token_name: Optional[str] = None
 
 
+# Lowercase texts of bool values; any other text is False
+_BOOL_TRUE = frozenset({"yes", "true", "1"})
+_BOOL_FALSE = frozenset({"no", "false", "0"})
+
+# Bound parse method of a field: (field_info, cursor, strictness, defaults)
+FieldParser = Callable[[FieldInfo, ParseCursor, ParseStrictness, Dict[str, Any]], Any]
+
+# Parses all fields of a class: (cursor, strictness) -> field values
+ParseFields = Callable[[ParseCursor, ParseStrictness], Dict[str, Any]]
+
+# Name of the KiCadObject method that parses each field type
+_FIELD_PARSERS = {
+    FieldType.LIST: "_parse_list_field",
+    FieldType.OPTIONAL_FLAG: "_parse_flag_field",
+    FieldType.KICAD_OBJECT: "_parse_object_field",
+    FieldType.OPTIONAL_KICAD_OBJECT: "_parse_object_field",
+    FieldType.PRIMITIVE: "_parse_primitive_field",
+    FieldType.OPTIONAL_PRIMITIVE: "_parse_primitive_field",
+}
+
+
 @dataclass
 class KiCadObject(ABC):
     """Base class for KiCad S-expression objects with cursor-based parsing."""
@@ -84,6 +141,22 @@ class KiCadObject(ABC):
     __token_name__: ClassVar[str] = ""
     _field_info_cache: ClassVar[List[FieldInfo]]
     _field_defaults_cache: ClassVar[Dict[str, Any]]
+    _to_sexpr_impl: ClassVar[Callable[[KiCadObject], SExpr]]
+    _field_parser_cache: ClassVar[List[Tuple[FieldInfo, FieldParser]]]
+    _parse_fields_impl: ClassVar[ParseFields]
+    _direct_init_count: ClassVar[int]
+    # Every subclass, in definition order
+    _registry: ClassVar[List[Type[KiCadObject]]] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register each subclass when it is defined."""
+        super().__init_subclass__(**kwargs)
+        KiCadObject._registry.append(cls)
+        token_name = cls.__dict__.get("__token_name__")
+        if token_name:
+            # Token lookups are keyed by the reader's interned symbol names;
+            # interning the class side too lets them match on identity.
+            cls.__token_name__ = sys.intern(token_name)
 
     def __post_init__(self) -> None:
         """Validate token name is defined."""
@@ -102,15 +175,18 @@ class KiCadObject(ABC):
 
         # Create parser only once here
         if isinstance(sexpr, str):
-            parser = SExprParser.from_string(sexpr)
-            sexpr = parser.sexpr
+            # Parsing only reads the tree, so the cached one can be shared
+            sexpr = str_to_sexpr(sexpr, copy=False)
+            parser = SExprParser(sexpr)
         else:
             parser = SExprParser(
                 sexpr, track_usage=(strictness == ParseStrictness.COMPLETE)
             )
 
         # Create cursor with parser and parse directly
-        cursor = ParseCursor(sexpr=sexpr, parser=parser, path=[cls.__name__])
+        cursor = ParseCursor(
+            sexpr=sexpr, parser=parser, path=[cls.__name__], token_index={}
+        )
         return cls._parse_recursive(cursor, strictness)
 
     @classmethod
@@ -120,7 +196,7 @@ class KiCadObject(ABC):
         strictness: ParseStrictness = ParseStrictness.STRICT,
     ) -> T:
         """Parse from S-expression string - convenience method for better clarity."""
-        sexpr = str_to_sexpr(sexpr_string)
+        sexpr = str_to_sexpr(sexpr_string, copy=False)
         return cls.from_sexpr(sexpr, strictness)
 
     @classmethod
@@ -129,37 +205,52 @@ class KiCadObject(ABC):
     ) -> T:
         """Internal recursive parse function - uses existing parser."""
 
-        if not cursor.sexpr or str(cursor.sexpr[0]) != cls.__token_name__:
-            raise ValueError(
-                f"Token mismatch at {cursor.get_path_str()}: "
-                f"expected '{cls.__token_name__}', got '{cursor.sexpr[0] if cursor.sexpr else 'empty'}'"
-            )
-
-        field_infos = cls._classify_fields()
-        field_defaults = cls._get_field_defaults()
-        parsed_values = {}
+        cls._check_token(cursor.sexpr, cursor.path)
 
-        for field_info in field_infos:
-            value = cls._parse_field_recursive(
-                field_info, cursor, strictness, field_defaults
-            )
-            if value is not None:
-                parsed_values[field_info.name] = value
-            elif field_info.name in field_defaults:
-                parsed_values[field_info.name] = field_defaults[field_info.name]
+        parse_fields: Optional[ParseFields] = cls.__dict__.get("_parse_fields_impl")
+        if parse_fields is None:
+            parse_fields = cls._build_parse_fields()
+        cursor.index_tokens()
+        parsed_values = parse_fields(cursor, strictness)
 
         # Usage check only at root level (where parser was created)
         if strictness == ParseStrictness.COMPLETE and len(cursor.path) == 1:
             cursor.parser.check_complete_usage(cls.__name__)
 
+        if len(parsed_values) == cls._direct_init_count:
+            # Every field has a value, parsed or defaulted, so __init__ would
+            # only assign them and is skipped
+            obj = object.__new__(cls)
+            obj.__dict__.update(parsed_values)
+            return obj
         return cls(**parsed_values)
 
+    @classmethod
+    def _check_token(cls, sexpr: SExpr, path: List[str]) -> None:
+        """Raise ValueError unless sexpr starts with the token of this class."""
+        # Symbol names and token names are both interned, so the comparison
+        # is decided on identity; reading _s skips the Python-level __str__
+        if (
+            not sexpr
+            or (sexpr[0]._s if type(sexpr[0]) is Symbol else str(sexpr[0]))
+            != cls.__token_name__
+        ):
+            raise ValueError(
+                f"Token mismatch at {' > '.join(path)}: "
+                f"expected '{cls.__token_name__}', got '{sexpr[0] if sexpr else 'empty'}'"
+            )
+
     @classmethod
     def _classify_fields(cls) -> List[FieldInfo]:
-        """Pre-classify all fields for optimized parsing with caching."""
-        if not hasattr(cls, "_field_info_cache"):
+        """Pre-classify all fields for optimized parsing with caching.
+
+        The result is stored on the class itself; looking it up in the class
+        __dict__ keeps a subclass from reusing its parent's classification.
+        """
+        field_infos: Optional[List[FieldInfo]] = cls.__dict__.get("_field_info_cache")
+        if field_infos is None:
             field_types = get_type_hints(cls)
-            field_infos: List[FieldInfo] = []
+            field_infos = []
             position_index = 0
 
             for field in fields(cls):
@@ -173,16 +264,20 @@ class KiCadObject(ABC):
 
             cls._field_info_cache = field_infos
 
-        return cls._field_info_cache
+        return field_infos
 
     @classmethod
     def _get_field_defaults(cls) -> Dict[str, Any]:
-        """Get field defaults with caching."""
-        if not hasattr(cls, "_field_defaults_cache"):
-            cls._field_defaults_cache = {
+        """Get field defaults with caching (per class, like _classify_fields)."""
+        field_defaults: Optional[Dict[str, Any]] = cls.__dict__.get(
+            "_field_defaults_cache"
+        )
+        if field_defaults is None:
+            field_defaults = {
                 f.name: f.default for f in fields(cls) if f.default != MISSING
             }
-        return cls._field_defaults_cache
+            cls._field_defaults_cache = field_defaults
+        return field_defaults
 
     @classmethod
     def _classify_field(
@@ -256,53 +351,167 @@ class KiCadObject(ABC):
         )
 
     @classmethod
-    def _parse_field_recursive(
+    def _get_field_parsers(cls) -> List[Tuple[FieldInfo, FieldParser]]:
+        """Get each field with the parse method for its field type.
+
+        The dispatch on the field type is done once per class, so parsing
+        calls the matching method directly. Cached like _classify_fields.
+        """
+        field_parsers: Optional[List[Tuple[FieldInfo, FieldParser]]] = cls.__dict__.get(
+            "_field_parser_cache"
+        )
+        if field_parsers is None:
+            field_parsers = [
+                (field_info, getattr(cls, _FIELD_PARSERS[field_info.field_type]))
+                for field_info in cls._classify_fields()
+            ]
+            cls._field_parser_cache = field_parsers
+        return field_parsers
+
+    @classmethod
+    def _build_parse_fields(cls) -> ParseFields:
+        """Generate and cache the function parsing all fields of this class.
+
+        The counterpart of _build_to_sexpr: the loop over
+        _get_field_parsers is unrolled, and whether a field falls back to
+        its default is decided when the code is generated.
+        """
+        field_defaults = cls._get_field_defaults()
+        namespace: Dict[str, Any] = {"field_defaults": field_defaults}
+        lines = [
+            "def parse_fields(cursor, strictness):",
+            "    parsed_values = {}",
+            "    sexpr = cursor.sexpr",
+            "    token_index = cursor.token_index",
+        ]
+
+        for i, (field_info, parse_field) in enumerate(cls._get_field_parsers()):
+            name = field_info.name
+            namespace[f"field_{i}"] = field_info
+            namespace[f"parse_{i}"] = parse_field
+            indent = "    "
+            if field_info.field_type in (
+                FieldType.PRIMITIVE,
+                FieldType.OPTIONAL_PRIMITIVE,
+            ):
+                # Fast path for the common (token value ...) shape: without a
+                # named (field value) token, an atom at the field's position
+                # that the reader already typed is used as is. Everything
+                # else goes through the parse method.
+                position = field_info.position_index + 1  # Skip token name
+                namespace[f"type_{i}"] = field_info.inner_type
+                lines += [
+                    f"    if {name!r} not in token_index and len(sexpr) > {position}"
+                    f" and type(sexpr[{position}]) is type_{i}:",
+                    f"        cursor.parser.mark_used({position})",
+                    f"        parsed_values[{name!r}] = sexpr[{position}]",
+                    "    else:",
+                ]
+                indent = "        "
+            lines += [
+                f"{indent}value = parse_{i}(field_{i}, cursor, strictness, field_defaults)",
+                f"{indent}if value is not None:",
+                f"{indent}    parsed_values[{name!r}] = value",
+            ]
+            if name in field_defaults:
+                namespace[f"default_{i}"] = field_defaults[name]
+                lines += [
+                    f"{indent}else:",
+                    f"{indent}    parsed_values[{name!r}] = default_{i}",
+                ]
+
+        lines.append("    return parsed_values")
+        exec("\n".join(lines), namespace)
+        parse_fields = cast(ParseFields, namespace["parse_fields"])
+        cls._parse_fields_impl = parse_fields
+        # Objects may skip __init__ when all their fields were parsed, unless
+        # __init__ does more than assign fields (-1 never matches)
+        init_fields = [f for f in fields(cls) if f.init]
+        direct_init = (
+            cls.__post_init__ is KiCadObject.__post_init__
+            and cls._has_dataclass_init()
+            and bool(cls.__token_name__)
+            and len(init_fields) == len(fields(cls)) == len(cls._classify_fields())
+        )
+        cls._direct_init_count = len(init_fields) if direct_init else -1
+        return parse_fields
+
+    @classmethod
+    def _has_dataclass_init(cls) -> bool:
+        """Check if the __init__ the class resolves to was made by @dataclass."""
+        for klass in cls.__mro__:
+            if "__init__" in klass.__dict__:
+                params = klass.__dict__.get("__dataclass_params__")
+                return params is not None and params.init
+        return False
+
+    @classmethod
+    def _parse_list_field(
         cls,
         field_info: FieldInfo,
         cursor: ParseCursor,
         strictness: ParseStrictness,
         field_defaults: Dict[str, Any],
     ) -> Any:
-        """Simplified logic with correct Required/Optional handling."""
+        """Parse a LIST field."""
+        return cls._parse_list_with_cursor(field_info, cursor, strictness)
 
-        if field_info.field_type == FieldType.LIST:
-            return cls._parse_list_with_cursor(field_info, cursor, strictness)
-
-        elif field_info.field_type == FieldType.OPTIONAL_FLAG:
-            return cls._parse_optional_flag_with_cursor(field_info, cursor)
+    @classmethod
+    def _parse_flag_field(
+        cls,
+        field_info: FieldInfo,
+        cursor: ParseCursor,
+        strictness: ParseStrictness,
+        field_defaults: Dict[str, Any],
+    ) -> Any:
+        """Parse an OPTIONAL_FLAG field."""
+        return cls._parse_optional_flag_with_cursor(field_info, cursor)
 
-        elif field_info.field_type in (
-            FieldType.KICAD_OBJECT,
-            FieldType.OPTIONAL_KICAD_OBJECT,
-        ):
-            result = cls._parse_nested_object(field_info, cursor, strictness)
-            # Validation: Required objects must be found
-            if result is None and field_info.field_type == FieldType.KICAD_OBJECT:
-                if strictness == ParseStrictness.STRICT:
-                    raise ValueError(
-                        f"{cursor.get_path_str()}: Required object '{field_info.name}' not found"
-                    )
-                elif strictness == ParseStrictness.LENIENT:
-                    logging.warning(
-                        f"{cursor.get_path_str()}: Required object '{field_info.name}' missing"
-                    )
-            return result
+    @classmethod
+    def _parse_object_field(
+        cls,
+        field_info: FieldInfo,
+        cursor: ParseCursor,
+        strictness: ParseStrictness,
+        field_defaults: Dict[str, Any],
+    ) -> Any:
+        """Parse a KICAD_OBJECT or OPTIONAL_KICAD_OBJECT field."""
+        result = cls._parse_nested_object(field_info, cursor, strictness)
+        # Validation: Required objects must be found
+        if result is None and field_info.field_type == FieldType.KICAD_OBJECT:
+            if strictness == ParseStrictness.STRICT:
+                raise ValueError(
+                    f"{cursor.get_path_str()}: Required object '{field_info.name}' not found"
+                )
+            elif strictness == ParseStrictness.LENIENT:
+                logging.warning(
+                    f"{cursor.get_path_str()}: Required object '{field_info.name}' missing"
+                )
+        return result
 
-        else:  # PRIMITIVE or OPTIONAL_PRIMITIVE
-            result = cls._parse_primitive_with_cursor(
-                field_info, cursor, strictness, field_defaults
-            )
-            # Validation: Required primitives must be found
-            if result is None and field_info.field_type == FieldType.PRIMITIVE:
-                if strictness == ParseStrictness.STRICT:
-                    raise ValueError(
-                        f"{cursor.get_path_str()}: Required field '{field_info.name}' not found"
-                    )
-                elif strictness == ParseStrictness.LENIENT:
-                    logging.warning(
-                        f"{cursor.get_path_str()}: Required field '{field_info.name}' missing"
-                    )
-            return result
+    @classmethod
+    def _parse_primitive_field(
+        cls,
+        field_info: FieldInfo,
+        cursor: ParseCursor,
+        strictness: ParseStrictness,
+        field_defaults: Dict[str, Any],
+    ) -> Any:
+        """Parse a PRIMITIVE or OPTIONAL_PRIMITIVE field."""
+        result = cls._parse_primitive_with_cursor(
+            field_info, cursor, strictness, field_defaults
+        )
+        # Validation: Required primitives must be found
+        if result is None and field_info.field_type == FieldType.PRIMITIVE:
+            if strictness == ParseStrictness.STRICT:
+                raise ValueError(
+                    f"{cursor.get_path_str()}: Required field '{field_info.name}' not found"
+                )
+            elif strictness == ParseStrictness.LENIENT:
+                logging.warning(
+                    f"{cursor.get_path_str()}: Required field '{field_info.name}' missing"
+                )
+        return result
 
     @classmethod
     def _parse_list_with_cursor(
@@ -313,33 +522,33 @@ class KiCadObject(ABC):
     ) -> List[Any]:
         """Parse list of values with cursor tracking."""
         result: List[Any] = []
-        sexpr_data = cursor.sexpr[1:]  # Skip token name
 
         if field_info.token_name:  # List of KiCadObjects
-            for i, item in enumerate(sexpr_data, 1):
-                if (
-                    isinstance(item, list)
-                    and item
-                    and str(item[0]) == field_info.token_name
-                ):
-                    cursor.parser.mark_used(i)  # Mark in main parser
-                    item_cursor = cursor.enter(
-                        item, f"{field_info.token_name}[{len(result)}]"
-                    )
-                    parsed_item = field_info.inner_type._parse_recursive(
-                        item_cursor, strictness
-                    )
-                    result.append(parsed_item)
+            for i in cursor.find_tokens(field_info.token_name):
+                item = cursor.sexpr[i]
+                cursor.parser.mark_used(i)  # Mark in main parser
+                item_cursor = cursor.enter(
+                    item, f"{field_info.token_name}[{len(result)}]"
+                )
+                parsed_item = field_info.inner_type._parse_recursive(
+                    item_cursor, strictness
+                )
+                result.append(parsed_item)
         else:  # List of primitives: (field_name val1 val2 val3)
-            for i, item in enumerate(sexpr_data, 1):
-                if (
-                    isinstance(item, list)
-                    and len(item) > 1
-                    and str(item[0]) == field_info.name
-                ):
+            for i in cursor.find_tokens(field_info.name):
+                item = cursor.sexpr[i]
+                if len(item) > 1:
                     cursor.parser.mark_used(i)  # Mark in main parser
+                    inner_type = field_info.inner_type
+                    if inner_type is int or inner_type is float:
+                        # Numbers convert in one pass; on error the loop
+                        # below raises with the usual message
+                        try:
+                            return [inner_type(value) for value in item[1:]]
+                        except (TypeError, ValueError):
+                            pass
                     for value in item[1:]:
-                        converted = cls._convert_value(value, field_info.inner_type)
+                        converted = cls._convert_value(value, inner_type)
                         result.append(converted)
                     break
 
@@ -356,19 +565,13 @@ class KiCadObject(ABC):
         if not field_info.token_name:
             return None
 
-        sexpr_data = cursor.sexpr[1:]  # Skip token name
-        for i, item in enumerate(sexpr_data, 1):
-            if (
-                isinstance(item, list)
-                and item
-                and str(item[0]) == field_info.token_name
-            ):
-                cursor.parser.mark_used(i)  # Mark in main parser
-                nested_cursor = cursor.enter(item, field_info.token_name)
-                return cast(
-                    KiCadObject,
-                    field_info.inner_type._parse_recursive(nested_cursor, strictness),
-                )
+        for i in cursor.find_tokens(field_info.token_name):
+            cursor.parser.mark_used(i)  # Mark in main parser
+            nested_cursor = cursor.enter(cursor.sexpr[i], field_info.token_name)
+            return cast(
+                KiCadObject,
+                field_info.inner_type._parse_recursive(nested_cursor, strictness),
+            )
 
         return None
 
@@ -380,9 +583,11 @@ class KiCadObject(ABC):
     ) -> OptionalFlag:
         """Parse OptionalFlag with cursor tracking."""
         sexpr_data = cursor.sexpr[1:]  # Skip token name
+        flag_name = field_info.name
 
         for i, item in enumerate(sexpr_data, 1):
-            if str(item) == field_info.name:
+            # Flags are atoms; str() of a nested list would render it entirely
+            if not isinstance(item, list) and str(item) == flag_name:
                 cursor.parser.mark_used(i)  # Mark in main parser
                 result = OptionalFlag(field_info.name)
                 result.__found__ = True
@@ -400,15 +605,10 @@ class KiCadObject(ABC):
         field_defaults: Dict[str, Any],
     ) -> Any:
         """Parse primitive value with cursor tracking."""
-        sexpr_data = cursor.sexpr[1:]  # Skip token name
-
         # Try named field first: (field_name value)
-        for i, item in enumerate(sexpr_data, 1):
-            if (
-                isinstance(item, list)
-                and len(item) >= 2
-                and str(item[0]) == field_info.name
-            ):
+        for i in cursor.find_tokens(field_info.name):
+            item = cursor.sexpr[i]
+            if len(item) >= 2:
                 cursor.parser.mark_used(i)  # Mark in main parser
                 try:
                     return cls._convert_value(item[1], field_info.inner_type)
@@ -423,12 +623,11 @@ class KiCadObject(ABC):
                         )
 
         # Try positional access
-        if field_info.position_index < len(sexpr_data):
-            value = sexpr_data[field_info.position_index]
+        position = field_info.position_index + 1  # Skip token name
+        if position < len(cursor.sexpr):
+            value = cursor.sexpr[position]
             if not isinstance(value, list):
-                cursor.parser.mark_used(
-                    field_info.position_index + 1
-                )  # Mark in main parser
+                cursor.parser.mark_used(position)  # Mark in main parser
                 try:
                     return cls._convert_value(value, field_info.inner_type)
                 except ValueError as e:
@@ -468,6 +667,8 @@ class KiCadObject(ABC):
         """Convert value to target type with error handling."""
         if value is None:
             raise ValueError(f"Cannot convert None to {target_type.__name__}")
+        if type(value) is target_type:
+            return value  # Numbers and strings mostly come from the reader typed
 
         try:
             if target_type == int:
@@ -477,7 +678,13 @@ class KiCadObject(ABC):
             elif target_type == float:
                 return float(value)
             elif target_type == bool:
-                return str(value).lower() in ("yes", "true", "1")
+                text = str(value)
+                # The usual lowercase spellings are decided without lower()
+                if text in _BOOL_TRUE:
+                    return True
+                if text in _BOOL_FALSE:
+                    return False
+                return text.lower() in _BOOL_TRUE
             elif isinstance(target_type, type) and issubclass(target_type, Enum):
                 # Handle enum conversion - try by value first, then by name
                 if isinstance(value, target_type):
@@ -493,58 +700,122 @@ class KiCadObject(ABC):
             raise ValueError(f"Cannot convert '{value}' to {target_type.__name__}: {e}")
 
     def to_sexpr(self) -> SExpr:
-        """Convert to S-expression using simple field iteration."""
-        result: SExpr = [self.__token_name__]
-        field_infos = self._classify_fields()
-        field_defaults = self._get_field_defaults()
+        """Convert to S-expression using the serializer generated for the class."""
+        to_sexpr_impl: Optional[Callable[[KiCadObject], SExpr]] = type(
+            self
+        ).__dict__.get("_to_sexpr_impl")
+        if to_sexpr_impl is None:
+            to_sexpr_impl = type(self)._build_to_sexpr()
+        return to_sexpr_impl(self)
 
-        for field_info in field_infos:
-            value = getattr(self, field_info.name)
+    @classmethod
+    def _build_to_sexpr(cls) -> Callable[[KiCadObject], SExpr]:
+        """Generate and cache a to_sexpr function for this class.
+
+        Like dataclasses does for __init__, the code is generated once from
+        the field classification: attribute access is unrolled and the
+        optional/default checks are decided up front, leaving only the
+        type checks on the actual values for every call.
+        """
+        field_defaults = cls._get_field_defaults()
+        namespace: Dict[str, Any] = {
+            "KiCadObject": KiCadObject,
+            "OptionalFlag": OptionalFlag,
+            "Enum": Enum,
+            "_PLAIN_TYPES": _PLAIN_TYPES,
+        }
+        lines = [
+            "def to_sexpr(self):",
+            f"    result = [{cls.__token_name__!r}]",
+            "    append = result.append",
+        ]
+
+        for i, field_info in enumerate(cls._classify_fields()):
+            name = field_info.name
+            # isinstance() against the KiCadObject ABC is slow, so values
+            # of exactly the annotated class are recognized by type() first
+            namespace[f"type_{i}"] = field_info.inner_type
+            lines.append(f"    value = self.{name}")
 
             # Lists are never None - always serialize (even if empty)
             if field_info.field_type == FieldType.LIST:
-                if isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, KiCadObject):
-                            result.append(item.to_sexpr())
-                        elif isinstance(item, Enum):
-                            result.append(item.value)
-                        else:
-                            result.append(item)
-                # Empty lists are serialized as empty, not skipped
-
-            elif value is None:
-                is_optional_field = field_info.field_type in (
-                    FieldType.OPTIONAL_PRIMITIVE,
-                    FieldType.OPTIONAL_KICAD_OBJECT,
-                    FieldType.OPTIONAL_FLAG,
-                )
-                has_default = field_info.name in field_defaults
-
-                if is_optional_field or has_default:
-                    continue  # Skip optional None fields
-                else:
-                    raise ValueError(
-                        f"Required field '{field_info.name}' is None in {self.__class__.__name__}. "
-                        f"Field type: {field_info.field_type}"
+                # All items are converted in one comprehension and added with
+                # a single extend, testing the expected item kind first
+                inner_type = field_info.inner_type
+                if isinstance(inner_type, type) and issubclass(inner_type, KiCadObject):
+                    item_expr = (
+                        f"item.to_sexpr() if type(item) is type_{i}"
+                        " or isinstance(item, KiCadObject)"
+                        " else item.value if isinstance(item, Enum) else item"
                     )
-            else:
-                # Normal serialization for primitives/objects
-                if isinstance(value, KiCadObject):
-                    result.append(value.to_sexpr())
-                elif isinstance(value, OptionalFlag):
-                    # Only add the flag to the result if it was found
-                    if value.is_present():
-                        result.append(value.get_value())
                 else:
-                    # Primitives as named fields: (field_name value)
-                    # Convert enum to its value for serialization
-                    if isinstance(value, Enum):
-                        result.append([field_info.name, value.value])
-                    else:
-                        result.append([field_info.name, value])
+                    item_expr = (
+                        "item if type(item) in _PLAIN_TYPES"
+                        " else item.to_sexpr() if isinstance(item, KiCadObject)"
+                        " else item.value if isinstance(item, Enum) else item"
+                    )
+                lines += [
+                    "    if isinstance(value, list):",
+                    f"        result += [{item_expr} for item in value]",
+                ]
+                continue
 
-        return result
+            is_optional_field = field_info.field_type in (
+                FieldType.OPTIONAL_PRIMITIVE,
+                FieldType.OPTIONAL_KICAD_OBJECT,
+                FieldType.OPTIONAL_FLAG,
+            )
+            if is_optional_field or name in field_defaults:
+                lines += ["    if value is None:", "        pass"]
+            else:
+                message = (
+                    f"Required field '{name}' is None in {cls.__name__}. "
+                    f"Field type: {field_info.field_type}"
+                )
+                lines += [
+                    "    if value is None:",
+                    f"        raise ValueError({message!r})",
+                ]
+
+            # The branches are mutually exclusive, so the one expected for
+            # the field type is tested first
+            if field_info.field_type in (
+                FieldType.PRIMITIVE,
+                FieldType.OPTIONAL_PRIMITIVE,
+            ):
+                lines += [
+                    "    elif type(value) in _PLAIN_TYPES:",
+                    f"        append([{name!r}, value])",
+                ]
+            elif field_info.field_type == FieldType.OPTIONAL_FLAG:
+                lines += [
+                    "    elif isinstance(value, OptionalFlag):",
+                    "        if value.is_present():",
+                    "            append(value.get_value())",
+                ]
+            else:
+                lines += [
+                    f"    elif type(value) is type_{i}:",
+                    "        append(value.to_sexpr())",
+                ]
+            lines += [
+                "    elif isinstance(value, KiCadObject):",
+                "        append(value.to_sexpr())",
+                "    elif isinstance(value, OptionalFlag):",
+                # Only add the flag to the result if it was found
+                "        if value.is_present():",
+                "            append(value.get_value())",
+                "    elif isinstance(value, Enum):",
+                f"        append([{name!r}, value.value])",
+                "    else:",
+                f"        append([{name!r}, value])",
+            ]
+
+        lines.append("    return result")
+        exec("\n".join(lines), namespace)
+        to_sexpr_impl = cast(Callable[[KiCadObject], SExpr], namespace["to_sexpr"])
+        cls._to_sexpr_impl = to_sexpr_impl
+        return to_sexpr_impl
 
     def __eq__(self, other: object) -> bool:
         """Fast and robust equality comparison for KiCadObjects."""
@@ -658,8 +929,10 @@ class KiCadObject(ABC):
 class OptionalFlag:
     """Simple flag container for optional string tokens in S-expressions."""
 
+    __slots__ = ("_value_", "__found__")
+
     _value_: str
-    __found__: bool = False
+    __found__: bool
 
     def __init__(self, value: str):
         self._value_ = value
@@ -1,7 +1,8 @@
 """Board layout elements for KiCad S-expressions - PCB/board design and routing."""
 
+import pathlib
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from .advanced_graphics import GrText
 from .base_element import KiCadObject, ParseStrictness
@@ -18,6 +19,7 @@ from .base_types import (
 )
 from .footprint_library import Footprint
 from .pad_and_drill import Net
+from .sexpr_parser import read_sexpr_file
 from .text_and_documents import Generator, Page, Version
 from .zone_system import Zone
 
@@ -531,26 +533,26 @@ class KicadPcb(KiCadObject):
     @classmethod
     def from_file(
         cls,
-        file_path: str,
+        file_path: Union[str, pathlib.Path],
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> "KicadPcb":
         """Parse from S-expression file - convenience method for PCB operations."""
-        if not file_path.endswith(".kicad_pcb"):
+        if pathlib.Path(file_path).suffix != ".kicad_pcb":
             raise ValueError("Unsupported file extension. Expected: .kicad_pcb")
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
+        content = read_sexpr_file(file_path, encoding)
         return cls.from_str(content, strictness)
 
-    def save_to_file(self, file_path: str, encoding: str = "utf-8") -> None:
+    def save_to_file(
+        self, file_path: Union[str, pathlib.Path], encoding: str = "utf-8"
+    ) -> None:
         """Save to .kicad_pcb file format.
 
         Args:
             file_path: Path to write the .kicad_pcb file
             encoding: File encoding (default: utf-8)
         """
-        if not file_path.endswith(".kicad_pcb"):
+        if pathlib.Path(file_path).suffix != ".kicad_pcb":
             raise ValueError("Unsupported file extension. Expected: .kicad_pcb")
         content = self.to_sexpr_str(pretty_print=True)
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        pathlib.Path(file_path).write_text(content, encoding=encoding)
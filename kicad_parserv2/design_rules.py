@@ -1,11 +1,12 @@
 """Design rules elements for KiCad S-expressions - design rule constraint system."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 
 from .base_element import KiCadObject, ParseStrictness
 from .enums import ConstraintType, SeverityLevel
-from .sexpr_parser import sexpr_to_str
+from .sexpr_parser import read_sexpr_file, sexpr_to_str
 from .text_and_documents import Version
 
 
@@ -284,7 +285,7 @@ class KiCadDesignRules(KiCadObject):
     @classmethod
     def from_file(
         cls,
-        file_path: str,
+        file_path: Union[str, Path],
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> "KiCadDesignRules":
@@ -293,11 +294,10 @@ class KiCadDesignRules(KiCadObject):
         Design rules files (.kicad_dru) have a special format without root token wrapping.
         This method handles the preprocessing needed for the parser.
         """
-        if not file_path.endswith(".kicad_dru"):
+        if Path(file_path).suffix != ".kicad_dru":
             raise ValueError("Unsupported file extension. Expected: .kicad_dru")
 
-        with open(file_path, "r", encoding=encoding) as f:
-            raw_content = f.read()
+        raw_content = read_sexpr_file(file_path, encoding)
 
         return cls.from_str(raw_content, strictness)
 
@@ -345,7 +345,7 @@ class KiCadDesignRules(KiCadObject):
 
         return "\n".join(lines)
 
-    def to_dru_file(self, file_path: str, encoding: str = "utf-8") -> None:
+    def to_dru_file(self, file_path: Union[str, Path], encoding: str = "utf-8") -> None:
         """Write to .kicad_dru file format.
 
         Args:
@@ -353,5 +353,4 @@ class KiCadDesignRules(KiCadObject):
             encoding: File encoding (default: utf-8)
         """
         content = self.to_dru_str(pretty_print=True)
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        Path(file_path).write_text(content, encoding=encoding)
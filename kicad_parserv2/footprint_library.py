@@ -1,11 +1,13 @@
 """Footprint library elements for KiCad S-expressions - footprint management and properties."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 
 from .base_element import KiCadObject, ParseStrictness
 from .base_types import At, Clearance, Layer, Locked, Property, Rotate, Uuid, Width, Xyz
 from .pad_and_drill import Pad
+from .sexpr_parser import read_sexpr_file
 from .text_and_documents import Scale, Tedit
 
 
@@ -406,29 +408,29 @@ class Footprint(KiCadObject):
     @classmethod
     def from_file(
         cls,
-        file_path: str,
+        file_path: Union[str, Path],
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> "Footprint":
         """Parse from S-expression file - convenience method for footprint operations."""
-        if not file_path.endswith(".kicad_mod"):
+        if Path(file_path).suffix != ".kicad_mod":
             raise ValueError("Unsupported file extension. Expected: .kicad_mod")
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
+        content = read_sexpr_file(file_path, encoding)
         return cls.from_str(content, strictness)
 
-    def save_to_file(self, file_path: str, encoding: str = "utf-8") -> None:
+    def save_to_file(
+        self, file_path: Union[str, Path], encoding: str = "utf-8"
+    ) -> None:
         """Save to .kicad_mod file format.
 
         Args:
             file_path: Path to write the .kicad_mod file
             encoding: File encoding (default: utf-8)
         """
-        if not file_path.endswith(".kicad_mod"):
+        if Path(file_path).suffix != ".kicad_mod":
             raise ValueError("Unsupported file extension. Expected: .kicad_mod")
         content = self.to_sexpr_str(pretty_print=True)
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        Path(file_path).write_text(content, encoding=encoding)
 
 
 @dataclass
@@ -15,12 +15,29 @@ import copy
 import json
 from abc import ABC
 from dataclasses import MISSING, dataclass, field, fields
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin
+from pathlib import Path
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from .base_element import ParseStrictness
 
 T = TypeVar("T", bound="JsonObject")
 
+# (name, resolved type, default, default_factory) of an init field
+FieldPlan = Tuple[str, Any, Any, Any]
+
 
 @dataclass
 class JsonObject(ABC):
@@ -56,6 +73,7 @@ class JsonObject(ABC):
     _original_data: Optional[Dict[str, Any]] = field(
         default=None, init=False, repr=False
     )
+    _field_plan_cache: ClassVar[List[FieldPlan]]
 
     def __post_init__(self) -> None:
         """Post-initialization hook for subclasses."""
@@ -71,23 +89,45 @@ class JsonObject(ABC):
         Returns:
             Instance of the class
         """
-        class_fields = {f.name: f for f in fields(cls) if f.init}
         kwargs = {}
 
-        for field_name, field_obj in class_fields.items():
+        for field_name, field_type, default, default_factory in cls._get_field_plan():
             if field_name in data:
                 kwargs[field_name] = cls._parse_field_value(
-                    data[field_name], field_obj.type
+                    data[field_name], field_type
                 )
-            elif field_obj.default is not MISSING:
-                kwargs[field_name] = field_obj.default
-            elif field_obj.default_factory is not MISSING:
-                kwargs[field_name] = field_obj.default_factory()
+            elif default is not MISSING:
+                kwargs[field_name] = default
+            elif default_factory is not MISSING:
+                kwargs[field_name] = default_factory()
 
         instance = cls(**kwargs)
         instance._original_data = copy.deepcopy(data)
         return instance
 
+    @classmethod
+    def _get_field_plan(cls) -> List[FieldPlan]:
+        """Get the init fields with their resolved types, cached per class.
+
+        Like KiCadObject._classify_fields, the result is looked up in the
+        class __dict__ so a subclass never reuses its parent's plan.
+        """
+        plan: Optional[List[FieldPlan]] = cls.__dict__.get("_field_plan_cache")
+        if plan is None:
+            try:
+                field_types = get_type_hints(cls)
+            except NameError:
+                # Forward references to e.g. locally defined classes cannot
+                # be resolved; use the raw annotations instead
+                field_types = {}
+            plan = [
+                (f.name, field_types.get(f.name, f.type), f.default, f.default_factory)
+                for f in fields(cls)
+                if f.init
+            ]
+            cls._field_plan_cache = plan
+        return plan
+
     @classmethod
     def _parse_field_value(cls, value: Any, field_type: Any) -> Any:
         """Parse a field value based on its type annotation.
@@ -155,7 +195,7 @@ class JsonObject(ABC):
     @classmethod
     def from_file(
         cls: Type[T],
-        file_path: str,
+        file_path: Union[str, Path],
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> T:
@@ -175,8 +215,7 @@ class JsonObject(ABC):
             UnicodeDecodeError: If the file encoding is incorrect
         """
         # Subclasses should override this for file extension validation
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
+        content = Path(file_path).read_text(encoding=encoding)
 
         return cls.from_str(content, strictness)
 
@@ -199,14 +238,14 @@ class JsonObject(ABC):
         """Convert to full dictionary with all fields."""
         result = {}
 
-        for field_obj in fields(self):
-            if not field_obj.init or field_obj.name.startswith("_"):
+        for field_name, _, _, _ in self._get_field_plan():
+            if field_name.startswith("_"):
                 continue
 
-            value = getattr(self, field_obj.name)
+            value = getattr(self, field_name)
 
             if value is not MISSING:
-                result[field_obj.name] = self._serialize_value(value)
+                result[field_name] = self._serialize_value(value)
 
         return result
 
@@ -263,7 +302,10 @@ class JsonObject(ABC):
         )
 
     def save_to_file(
-        self, file_path: str, encoding: str = "utf-8", preserve_original: bool = False
+        self,
+        file_path: Union[str, Path],
+        encoding: str = "utf-8",
+        preserve_original: bool = False,
     ) -> None:
         """Save to JSON file format.
 
@@ -275,8 +317,7 @@ class JsonObject(ABC):
         content = self.to_json_str(
             pretty_print=True, preserve_original=preserve_original
         )
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        Path(file_path).write_text(content, encoding=encoding)
 
 
 def _is_json_object_type(type_hint: Any) -> bool:
@@ -1,7 +1,8 @@
 """Project settings elements for KiCad JSON project files - .kicad_pro format."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 from .base_element import ParseStrictness
 from .json_base_element import JsonObject
@@ -294,7 +295,7 @@ class KicadProject(JsonObject):
     @classmethod
     def from_file(
         cls,
-        file_path: str,
+        file_path: Union[str, Path],
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> "KicadProject":
@@ -308,13 +309,16 @@ class KicadProject(JsonObject):
         Returns:
             KicadProject instance
         """
-        if not file_path.endswith(".kicad_pro"):
+        if Path(file_path).suffix != ".kicad_pro":
             raise ValueError("Unsupported file extension. Expected: .kicad_pro")
 
         return super().from_file(file_path, strictness, encoding)
 
     def save_to_file(
-        self, file_path: str, encoding: str = "utf-8", preserve_original: bool = False
+        self,
+        file_path: Union[str, Path],
+        encoding: str = "utf-8",
+        preserve_original: bool = False,
     ) -> None:
         """Save to .kicad_pro file format.
 
@@ -323,7 +327,7 @@ class KicadProject(JsonObject):
             encoding: File encoding (default: utf-8)
             preserve_original: Whether to preserve original structure
         """
-        if not file_path.endswith(".kicad_pro"):
+        if Path(file_path).suffix != ".kicad_pro":
             raise ValueError("Unsupported file extension. Expected: .kicad_pro")
 
         super().save_to_file(file_path, encoding, preserve_original)
@@ -1,10 +1,12 @@
 """Schematic system elements for KiCad S-expressions - schematic drawing and connectivity."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Optional, Union
 
 from .base_element import KiCadObject, ParseStrictness
 from .base_types import At, Color, Effects, Fill, Property, Pts, Size, Stroke, Uuid
+from .sexpr_parser import read_sexpr_file
 from .symbol_library import LibSymbols, Pin
 from .text_and_documents import Generator, Version
 
@@ -488,26 +490,26 @@ class KicadSch(KiCadObject):
     @classmethod
     def from_file(
         cls,
-        file_path: str,
+        file_path: Union[str, Path],
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> "KicadSch":
         """Parse from S-expression file - convenience method for schematic operations."""
-        if not file_path.endswith(".kicad_sch"):
+        if Path(file_path).suffix != ".kicad_sch":
             raise ValueError("Unsupported file extension. Expected: .kicad_sch")
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
+        content = read_sexpr_file(file_path, encoding)
         return cls.from_str(content, strictness)
 
-    def save_to_file(self, file_path: str, encoding: str = "utf-8") -> None:
+    def save_to_file(
+        self, file_path: Union[str, Path], encoding: str = "utf-8"
+    ) -> None:
         """Save to .kicad_sch file format.
 
         Args:
             file_path: Path to write the .kicad_sch file
             encoding: File encoding (default: utf-8)
         """
-        if not file_path.endswith(".kicad_sch"):
+        if Path(file_path).suffix != ".kicad_sch":
             raise ValueError("Unsupported file extension. Expected: .kicad_sch")
         content = self.to_sexpr_str(pretty_print=True)
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        Path(file_path).write_text(content, encoding=encoding)
@@ -96,10 +96,12 @@ __all__ = [
 ]
 
 import re
+import sys
 from collections import namedtuple
 from collections.abc import Iterable, Mapping, Sequence
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from itertools import chain
+from math import isfinite
 from string import whitespace
 from typing import Any, Optional
 
@@ -508,6 +510,14 @@ def _(obj: String, **kwds) -> str:
 
 
 class Symbol(String):
+    """
+    Unquoted atom such as ``layer`` or ``F.Cu``.
+
+    ``position`` is only set when passed to the constructor.  Symbols
+    returned by the parser have no position (``None``): the reader does
+    not track positions for atoms, only errors report where they occur.
+    """
+
     _lisp_quoted_specials = [
         ("\\", "\\\\"),  # must come first to avoid doubly quoting "\"
         ("'", r"\'"),
@@ -526,6 +536,20 @@ class Symbol(String):
 
     _lisp_quoted_to_raw = dict((q, r) for (r, q) in _lisp_quoted_specials)
 
+    def __init__(self, object, position=None) -> None:
+        # Symbol names repeat constantly (every "at", "layer", ...), so
+        # interning shares one string per name and lets comparisons against
+        # other interned names succeed on identity.
+        self._s = sys.intern(str(object))
+        self.position = position
+
+    def __eq__(self, other) -> bool:
+        if self.__class__ is other.__class__ and self._s is other._s:
+            return True
+        return String.__eq__(self, other)
+
+    __hash__ = String.__hash__
+
 
 @tosexp.register(Symbol)
 def _(obj: Symbol, **kwds) -> str:
@@ -699,11 +723,60 @@ class InvalidEscape(SExpError):
         super().__init__(message, position)
 
 
+@lru_cache(maxsize=None)
+def _token_regexp(openers: str, closers: str, line_comment: str):
+    """
+    Build the tokenizer pattern for the given delimiters.
+
+    Each alternative is a capturing group so ``match.lastindex`` tells the
+    token kind without any further character inspection.  Whitespace in
+    front of a token is consumed by the same match, so the regular
+    expression engine skips it instead of a separate loop iteration; only
+    trailing whitespace produces an empty match at the end of the input.
+    The last group matches any other single character, which guarantees
+    that every position of the input is covered and only ever fires on
+    malformed input (a quote without its closing partner or a trailing
+    backslash).
+    """
+    ws = re.escape(whitespace)
+    brackets = re.escape(openers + closers)
+    comment_char = re.escape(line_comment) if len(line_comment) == 1 else ""
+    return re.compile(
+        r"[{ws}]*(?:"  # leading whitespace
+        r"([{opn}])"  # 1: opening bracket
+        r"|([{cls}])"  # 2: closing bracket
+        r'|("[^"\\]*(?:\\[\s\S][^"\\]*)*")'  # 3: string literal
+        r"|(')"  # 4: quote
+        r"|({com}[^\n]*)"  # 5: line comment
+        r'|((?:[^{ws}{brk}"\\{cc}]|\\[\s\S])+)'  # 6: atom
+        r"|([^{ws}])"  # 7: anything else (error)
+        r"|\Z)".format(  # end of input
+            ws=ws,
+            opn=re.escape(openers),
+            cls=re.escape(closers),
+            com=re.escape(line_comment),
+            brk=brackets,
+            cc=comment_char,
+        )
+    )
+
+
+_TOK_OPEN = 1
+_TOK_CLOSE = 2
+_TOK_STRING = 3
+_TOK_QUOTE = 4
+_TOK_COMMENT = 5
+_TOK_ATOM = 6
+
+_escape_re = re.compile(r"\\[\s\S]")
+# Atom values that are immutable in practice and safe to share in one parse
+_SHARED_ATOM_TYPES = (Symbol, int, float)
+_string_end_re = re.compile(r'"|\\')
+
+
 class Parser(object):
     brackets: dict[str, str]
     closing_brackets: set[str]
-    _atom_end_basic: set[str]
-    _atom_end_basic_or_escape_regexp: str
 
     def __init__(
         self,
@@ -721,49 +794,30 @@ class Parser(object):
         self.string_to = (lambda x: x) if string_to is None else string_to
         self.line_comment = line_comment
 
-        # Build position mapping for error reporting
-        self.position_map = self._build_position_map(string)
-
         # Compute brackets from delimiter
         self.brackets = Delimiters.get_brackets()
         self.closing_brackets = set(self.brackets.values())
-        self._atom_end_basic = (
-            set(self.brackets) | set(self.closing_brackets) | set('"') | set(whitespace)
-        )
-        self._atom_end_basic_or_escape_regexp = "|".join(
-            map(re.escape, self._atom_end_basic | set("\\"))
+        self.token_re = _token_regexp(
+            "".join(self.brackets), "".join(self.brackets.values()), line_comment
         )
-        self.quote_or_escape_re = re.compile(r'"|\\')
-        self.atom_end = set([line_comment]) | self._atom_end_basic
-        self.atom_end_or_escape_re = re.compile(
-            "{0}|{1}".format(
-                self._atom_end_basic_or_escape_regexp, re.escape(line_comment)
-            )
-        )
-
-    def _build_position_map(self, string: str) -> dict[int, Position]:
-        """Build a mapping from string offset to (line, column)"""
-        positions = {}
-        line, column = 1, 1
-        for i, char in enumerate(string):
-            positions[i] = Position(line, column, i)
-            if char == "\n":
-                line += 1
-                column = 1
-            else:
-                column += 1
-        positions[len(string)] = Position(line, column, len(string))
-        return positions
 
     def get_position(self, offset: int) -> Position:
-        """Get position information for a given string offset."""
-        return self.position_map.get(offset, Position())
+        """Get position information for a given string offset.
+
+        Positions are only needed for error reporting, so they are computed
+        on demand instead of being tracked for every character.
+        """
+        string = self.string
+        offset = max(0, min(offset, len(string)))
+        line = string.count("\n", 0, offset) + 1
+        column = offset - (string.rfind("\n", 0, offset) + 1) + 1
+        return Position(line, column, offset)
 
     def parse_str(self, i: int) -> tuple[int, str]:
         string = self.string
         chars: list[str] = []
         append = chars.append
-        search = self.quote_or_escape_re.search
+        search = _string_end_re.search
 
         start_pos = self.get_position(i)
         while True:
@@ -782,44 +836,8 @@ class Parser(object):
                 if i >= len(string):
                     raise InvalidEscape("EOF", self.get_position(end))
                 append(String.unquote(c + string[i]))
-        else:
-            raise ExpectClosingBracket('"', self.get_position())
         return (i, "".join(chars))
 
-    def parse_atom(self, i: int) -> tuple[int, Any]:
-        string = self.string
-        chars: list[str] = []
-        append = chars.append
-        search = self.atom_end_or_escape_re.search
-        atom_end = self.atom_end
-        start_pos = self.get_position(i)
-
-        while True:
-            match = search(string, i)
-            if not match:
-                append(string[i:])
-                i = len(string)
-                break
-            end = match.start()
-            append(string[i:end])
-            c = match.group()
-            if c in atom_end:
-                i = end  # this is different from str
-                break
-            elif c == "\\":
-                i = end + 1
-                if i >= len(string):
-                    raise InvalidEscape("EOF", self.get_position(end))
-                next_char = string[i]
-                try:
-                    unquoted = Symbol.unquote(c + next_char)
-                    append(unquoted)
-                except KeyError:
-                    raise InvalidEscape(next_char, self.get_position(i))
-            i += 1
-
-        return (i, self.atom("".join(chars), start_pos))
-
     def atom(self, token: str, position=None):
         if token == self.nil:
             return []
@@ -827,93 +845,127 @@ class Parser(object):
             return True
         if token == self.false:
             return False
-        try:
-            return int(token)
-        except ValueError:
+        # Numbers start with a sign, a dot or a digit; anything else is a
+        # symbol and can skip both failing conversions. int() and float()
+        # strip surrounding whitespace, so escaped whitespace (e.g. "\ 1")
+        # still goes through them.
+        first = token[0]
+        if first not in "+-." and not first.isdecimal() and not first.isspace():
+            return Symbol(token, position)
+        # int() never accepts a dot, so decimals skip its raised exception
+        if "." not in token:
             try:
-                result = float(token)
-                # Block automatic conversion to infinity or NaN
-                if (
-                    result in (float("inf"), float("-inf")) or result != result
-                ):  # NaN check
-                    raise ValueError("Invalid s-exp float")
-                return result
+                return int(token)
             except ValueError:
-                return Symbol(token, position)
-
-    def parse_sexp(self, i: int) -> tuple[int, list[Any]]:
-        string = self.string
-        len_string = len(self.string)
-        sexp: list[Any] = []
-        append = sexp.append
-        bracket_stack = []  # Track opening brackets for better error reporting
-
-        while i < len_string:
-            c = string[i]
-            current_pos = self.get_position(i)
-
-            if c == '"':
-                try:
-                    (i, parsed_str) = self.parse_str(i)
-                    append(self.string_to(parsed_str))
-                except SExpError:
-                    raise  # Re-raise with position already set
-            elif c in whitespace:
-                i += 1
-                continue
-            elif c in self.brackets:
-                close = self.brackets[c]
-                bracket_stack.append((c, close, current_pos))
-                (next_i, parsed_sexp) = self.parse_sexp(i + 1)
-                i = next_i
-                append(bracket(parsed_sexp, c))
-                try:
-                    nc = string[i]
-                except IndexError:
-                    bracket_info = bracket_stack[-1] if bracket_stack else None
-                    if bracket_info:
-                        raise ExpectClosingBracket(
-                            None, bracket_info[1], bracket_info[2]
-                        )
-                    else:
-                        raise ExpectClosingBracket(None, close, current_pos)
-                if nc != close:
-                    raise ExpectClosingBracket(nc, close, current_pos)
-                bracket_stack.pop() if bracket_stack else None
-                i += 1
-            elif c in self.closing_brackets:
-                break
-            elif c == "'":
-                quote_pos = current_pos
-                next_parse_start = i + 1
-                (next_i, parsed_sexp) = self.parse_sexp(next_parse_start)
-                i = next_i
-                if not parsed_sexp:
-                    raise ExpectSExp(quote_pos)
-                append(Quoted(parsed_sexp[0]))
-                sexp.extend(parsed_sexp[1:])
-            elif c == self.line_comment:
-                i = string.find("\n", i) + 1
-                if i <= 0:
-                    i = len_string
-                    break
-            else:
-                (i, parsed_atom) = self.parse_atom(i)
-                append(parsed_atom)
-        return (i, sexp)
+                pass
+        try:
+            result = float(token)
+        except ValueError:
+            return Symbol(token, position)
+        # Block automatic conversion to infinity or NaN
+        if not isfinite(result):
+            return Symbol(token, position)
+        return result
 
     def parse(self) -> list[Any]:
         try:
-            (i, sexp) = self.parse_sexp(0)
-            if i < len(self.string):
-                raise ExpectNothing(self.string[i:], self.get_position(i))
-            return sexp
+            return self._parse_tokens()
         except SExpError:
             raise  # Re-raise S-expression specific errors
         except Exception as e:
             # Wrap unexpected errors with position info if possible
             raise SExpError(f"Unexpected parsing error: {e}")
 
+    def _parse_tokens(self) -> list[Any]:
+        """
+        Build the nested lists from a single regular expression scan.
+
+        Nesting is tracked with an explicit stack instead of recursion, so
+        each token costs one loop iteration and deep expressions cannot hit
+        the interpreter's recursion limit.
+        """
+        string = self.string
+        string_to = self.string_to
+        atom = self.atom
+        brackets = self.brackets
+
+        sexp: list[Any] = []
+        # Each entry: (parent list, opener, opener offset, parent quotes)
+        stack: list[tuple[list[Any], str, int, list[int]]] = []
+        # Offsets of pending quote characters for the current level
+        quotes: list[int] = []
+        # Values repeat a lot (layer names, widths, coordinates); equal
+        # strings, symbols and numbers share one object per parse, and
+        # repeated atom tokens skip the conversion.
+        strings: dict[str, str] = {}
+        atoms: dict[str, Any] = {}
+
+        for match in self.token_re.finditer(string):
+            kind = match.lastindex
+            if kind is None or kind == _TOK_COMMENT:
+                continue
+
+            if kind == _TOK_OPEN:
+                stack.append((sexp, match.group(kind), match.start(kind), quotes))
+                sexp = []
+                quotes = []
+                continue
+
+            if kind == _TOK_CLOSE:
+                if quotes:
+                    raise ExpectSExp(self.get_position(quotes[0]))
+                closer = match.group(kind)
+                if not stack:
+                    start = match.start(kind)
+                    raise ExpectNothing(string[start:], self.get_position(start))
+                parent, opener, start, quotes = stack.pop()
+                if brackets[opener] != closer:
+                    raise ExpectClosingBracket(
+                        closer, brackets[opener], self.get_position(start)
+                    )
+                value = bracket(sexp, opener)
+                sexp = parent
+            elif kind == _TOK_STRING:
+                value = match.group(kind)[1:-1]
+                if "\\" in value:
+                    value = _escape_re.sub(lambda m: String.unquote(m.group()), value)
+                value = string_to(strings.setdefault(value, value))
+            elif kind == _TOK_ATOM:
+                token = match.group(kind)
+                value = atoms.get(token)
+                if value is None:
+                    value = token
+                    if "\\" in value:
+                        value = _escape_re.sub(
+                            lambda m: Symbol.unquote(m.group()), value
+                        )
+                    value = atom(value)
+                    # Symbols from the reader carry no position, so they can be
+                    # shared like numbers; nil's empty list must stay distinct
+                    if type(value) in _SHARED_ATOM_TYPES:
+                        atoms[token] = value
+            elif kind == _TOK_QUOTE:
+                quotes.append(match.start(kind))
+                continue
+            else:
+                start = match.start(kind)
+                if match.group(kind) == "\\":
+                    raise InvalidEscape("EOF", self.get_position(start))
+                self.parse_str(start)  # raises with the precise error
+                raise UnterminatedString(self.get_position(start))
+
+            for _ in quotes:
+                value = Quoted(value)
+            quotes.clear()
+            sexp.append(value)
+
+        if stack:
+            _, opener, start, _ = stack[-1]
+            raise ExpectClosingBracket(None, brackets[opener], self.get_position(start))
+        if quotes:
+            raise ExpectSExp(self.get_position(quotes[0]))
+        return sexp
+
 
 def parse(string: str, **kwds) -> list[Any]:
     """
@@ -6,20 +6,73 @@ Only contains the functions actually used by the kicad_parserv2 package.
 
 from __future__ import annotations
 
-from typing import Any, List, cast
+import mmap
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union, cast
 
-from .sexpdata import Symbol, dumps, loads
+from .sexpdata import String, Symbol, dumps, loads
 
 # Type definitions
 SExprValue = Any  # Can be Symbol, str, int, float, or nested list
 SExpr = List[SExprValue]
 
 
-def str_to_sexpr(content: str) -> SExpr:
+# Parsed trees take about 14 times the memory of their text, so only small
+# inputs are cached; whole boards or schematics are parsed on every call
+_CACHE_MAX_CONTENT = 64 * 1024
+
+
+@lru_cache(maxsize=64)
+def _loads_cached(content: str) -> SExpr:
+    """Parse content once and keep the result for identical inputs."""
+    return cast(SExpr, loads(content))
+
+
+def _copy_sexpr(sexpr: SExprValue) -> SExprValue:
+    """Copy the list structure of an S-expression, sharing the atoms."""
+    if isinstance(sexpr, list):
+        return [_copy_sexpr(item) if isinstance(item, list) else item for item in sexpr]
+    return sexpr
+
+
+def read_sexpr_file(file_path: Union[str, Path], encoding: str = "utf-8") -> str:
+    """Read an S-expression file into a string.
+
+    The file is memory-mapped and decoded in one step, so the raw bytes are
+    never copied into a Python object and no buffered text decoding is
+    needed. Line endings are normalized like in text mode.
+
+    Args:
+        file_path: Path to the file
+        encoding: File encoding
+
+    Returns:
+        Decoded file content
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, encoding)
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def str_to_sexpr(content: str, copy: bool = True) -> SExpr:
     """Convert string content to S-expression.
 
+    Identical inputs of up to 64K characters are only parsed once; by default
+    every call still returns its own list structure, so callers may modify
+    the result freely. Use clear_sexpr_cache() to release the cached results.
+
     Args:
         content: String content containing S-expression data
+        copy: Whether to return a private copy. Pass False only if the result
+            is never modified, e.g. when it is just parsed into objects.
 
     Returns:
         Parsed S-expression as nested lists/atoms
@@ -28,9 +81,135 @@ def str_to_sexpr(content: str) -> SExpr:
         ValueError: If content cannot be parsed as valid S-expression
     """
     try:
-        return cast(SExpr, loads(content))
+        if len(content) > _CACHE_MAX_CONTENT:
+            sexpr = cast(SExpr, loads(content))
+        else:
+            sexpr = _loads_cached(content)
     except Exception as e:
         raise ValueError(f"Failed to parse S-expression: {e}") from e
+    return cast(SExpr, _copy_sexpr(sexpr)) if copy else sexpr
+
+
+def clear_sexpr_cache() -> None:
+    """Drop the parse results kept by str_to_sexpr."""
+    _loads_cached.cache_clear()
+
+
+class _UseDumps(Exception):
+    """Raised by the fast writer for input that only sexpdata.dumps handles."""
+
+
+# sexpdata.dumps indents after each of these, even inside an atom, so atoms
+# containing them are left to dumps to keep the output identical.
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_STRING_ESCAPES = str.maketrans(dict(String._lisp_quoted_specials))
+_SYMBOL_ESCAPES = str.maketrans(dict(Symbol._lisp_quoted_specials))
+_STRING_SPECIALS = re.compile(
+    "[" + re.escape("".join(map(chr, _STRING_ESCAPES)) + _LINE_BREAKS) + "]"
+)
+_SYMBOL_SPECIALS = re.compile(
+    "[" + re.escape("".join(map(chr, _SYMBOL_ESCAPES)) + _LINE_BREAKS) + "]"
+)
+_LINE_BREAK_CHARS = re.compile("[" + re.escape(_LINE_BREAKS) + "]")
+_INDENT = "  "
+# Text of the small integers (counts, widths, layer and pin numbers, ...)
+_SMALL_INT_OFFSET = 256
+_SMALL_INT_LIMIT = 1024
+_SMALL_INT_STRS = tuple(str(i) for i in range(-_SMALL_INT_OFFSET, _SMALL_INT_LIMIT))
+# Text of floats seen before, as coordinates and sizes repeat a lot in KiCad
+# files. Only floats are looked up, so 1 and 1.0 never share an entry.
+_FLOAT_STRS: Dict[float, str] = {}
+_FLOAT_STRS_MAX = 4096
+
+
+def _quote(value: str, specials: re.Pattern[str], escapes: Dict[int, str]) -> str:
+    """Escape a string or symbol name like sexpdata does."""
+    if specials.search(value) is None:
+        return value
+    quoted = value.translate(escapes)
+    if _LINE_BREAK_CHARS.search(quoted):
+        raise _UseDumps
+    return quoted
+
+
+def _atom_to_str(value: SExprValue) -> str:
+    """Render an atom exactly like sexpdata.dumps."""
+    value_type = type(value)
+    if value_type is Symbol:
+        return _quote(value._s, _SYMBOL_SPECIALS, _SYMBOL_ESCAPES)
+    if value_type is str:
+        return '"' + _quote(value, _STRING_SPECIALS, _STRING_ESCAPES) + '"'
+    if value_type is float:
+        text = _FLOAT_STRS.get(value)
+        if text is None:
+            text = repr(value)
+            # Zero is left out: -0.0 == 0.0, but their text differs
+            if value and len(_FLOAT_STRS) < _FLOAT_STRS_MAX:
+                _FLOAT_STRS[value] = text
+        return text
+    if value_type is int:
+        if -_SMALL_INT_OFFSET <= value < _SMALL_INT_LIMIT:
+            return _SMALL_INT_STRS[value + _SMALL_INT_OFFSET]
+        return str(value)
+    if value_type is bool:
+        return "t" if value else "()"
+    if value is None:
+        return "()"
+    if value_type is String:
+        return '"' + _quote(value._s, _STRING_SPECIALS, _STRING_ESCAPES) + '"'
+    raise _UseDumps
+
+
+def _open_list(sexpr: SExpr, depth: int, pretty_print: bool) -> List[Any]:
+    """Create the writer frame of a list.
+
+    The frame holds the child iterator, the separator before the next child,
+    the separator for all later children, the closing text and the depth.
+    """
+    if pretty_print:
+        separator = "\n" + _INDENT * (depth + 1)
+        return [iter(sexpr), separator, separator, "\n" + _INDENT * depth + ")", depth]
+    return [iter(sexpr), "", " ", ")", depth]
+
+
+def _write_sexpr(sexpr: SExprValue, parts: List[str], pretty_print: bool) -> None:
+    """Append the text of an S-expression to parts in a single pass.
+
+    Produces the same text as sexpdata.dumps: with pretty_print, a list
+    holding another list puts each child on its own line, indented by its
+    depth; all other lists stay on one line. Lists that need their own
+    lines are kept on an explicit stack, so deep nesting costs no Python
+    call frames.
+    """
+    append = parts.append
+    if type(sexpr) is not list:
+        append(_atom_to_str(sexpr))
+        return
+    if pretty_print and not any(type(child) is list for child in sexpr):
+        append("(" + " ".join([_atom_to_str(child) for child in sexpr]) + ")")
+        return
+
+    append("(")
+    stack = [_open_list(sexpr, 0, pretty_print)]
+    while stack:
+        frame = stack[-1]
+        children, separator, next_separator, closing, depth = frame
+        for child in children:
+            append(separator)
+            separator = next_separator
+            if type(child) is not list:
+                append(_atom_to_str(child))
+            elif pretty_print and not any(type(item) is list for item in child):
+                append("(" + " ".join([_atom_to_str(item) for item in child]) + ")")
+            else:
+                # Descend; this frame resumes once the child list is closed
+                frame[1] = separator
+                append("(")
+                stack.append(_open_list(child, depth + 1, pretty_print))
+                break
+        else:
+            append(closing)
+            stack.pop()
 
 
 def sexpr_to_str(sexpr: SExpr, pretty_print: bool = True) -> str:
@@ -47,7 +226,12 @@ def sexpr_to_str(sexpr: SExpr, pretty_print: bool = True) -> str:
         ValueError: If sexpr cannot be serialized
     """
     try:
-        return dumps(sexpr, pretty_print=pretty_print)
+        try:
+            parts: List[str] = []
+            _write_sexpr(sexpr, parts, pretty_print)
+            return "".join(parts)
+        except _UseDumps:
+            return dumps(sexpr, pretty_print=pretty_print)
     except Exception as e:
         raise ValueError(f"Failed to serialize S-expression: {e}") from e
 
@@ -64,7 +248,17 @@ class SExprParser:
         """
         self.sexpr = sexpr
         self.track_usage = track_usage
-        self.used_indices: set[int] = set() if track_usage else set()
+        # Bit i is set once parameter i has been used
+        self._used_mask = 0
+        # Token name -> indices of matching sub-expressions, built on first
+        # lookup so parsers that never query tokens pay nothing.
+        self._token_index: Optional[Dict[str, List[int]]] = None
+
+    @property
+    def used_indices(self) -> set[int]:
+        """Indices of all parameters marked as used."""
+        mask = self._used_mask
+        return {i for i in range(mask.bit_length()) if (mask >> i) & 1}
 
     @classmethod
     def from_string(cls, sexpr_string: str) -> "SExprParser":
@@ -87,15 +281,33 @@ class SExprParser:
         Returns:
             List of S-expressions (empty list if none found)
         """
-        results = []
-        for item in self.sexpr:
-            if (
-                isinstance(item, list)
-                and len(item) > 0
-                and (item[0] == Symbol(token_name) or str(item[0]) == token_name)
-            ):
-                results.append(item)
-        return results
+        token_index = self._token_index
+        if token_index is None:
+            token_index = self._token_index = self._build_token_index()
+
+        positions = token_index.get(token_name, [])
+        if self.track_usage:
+            for index in positions:
+                self.mark_used(index)
+        sexpr = self.sexpr
+        return [sexpr[index] for index in positions]
+
+    def _build_token_index(self) -> Dict[str, List[int]]:
+        """Index all sub-expressions by their token name in a single pass."""
+        token_index: Dict[str, List[int]] = {}
+        for i, item in enumerate(self.sexpr):
+            # Empty lists are falsy, so no separate len() check is needed
+            if isinstance(item, list) and item:
+                head = item[0]
+                # Symbol names are interned by the reader, so the key can be
+                # used directly and later lookups hit the identity fast path.
+                key = head._s if isinstance(head, Symbol) else str(head)
+                positions = token_index.get(key)
+                if positions is None:
+                    token_index[key] = [i]
+                else:
+                    positions.append(i)
+        return token_index
 
     def mark_used(self, index: int) -> None:
         """Mark a parameter index as used.
@@ -104,7 +316,7 @@ class SExprParser:
             index: Index in sexpr that was accessed
         """
         if self.track_usage:
-            self.used_indices.add(index)
+            self._used_mask |= 1 << index
 
     def get_unused_parameters(self) -> List[Any]:
         """Get list of unused parameters.
@@ -115,12 +327,11 @@ class SExprParser:
         if not self.track_usage:
             return []
 
-        unused = []
+        used_mask = self._used_mask
         # Skip index 0 (token name) and check remaining parameters
-        for i in range(1, len(self.sexpr)):
-            if i not in self.used_indices:
-                unused.append(self.sexpr[i])
-        return unused
+        return [
+            self.sexpr[i] for i in range(1, len(self.sexpr)) if not (used_mask >> i) & 1
+        ]
 
     def check_complete_usage(self, class_name: str = "") -> None:
         """Check if all parameters were used and raise error if not.
@@ -134,8 +345,11 @@ class SExprParser:
         if not self.track_usage:
             return
 
-        unused = self.get_unused_parameters()
-        if unused:
+        # One bit per element, shifted past the token name; the common
+        # all-used case is decided without building the unused list.
+        unused_mask = (((1 << len(self.sexpr)) - 1) & ~self._used_mask) >> 1
+        if unused_mask:
+            unused = self.get_unused_parameters()
             class_info = f" in {class_name}" if class_name else ""
             raise ValueError(f"Unused parameters{class_info}: {unused}")
 
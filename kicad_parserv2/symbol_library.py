@@ -1,11 +1,13 @@
 """Symbol library elements for KiCad S-expressions - schematic symbol definitions."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, List, Optional, Union
 
 from .base_element import KiCadObject, OptionalFlag, ParseStrictness
 from .base_types import At, Effects, Property
 from .enums import PinElectricalType, PinGraphicStyle
+from .sexpr_parser import SExprParser, read_sexpr_file, str_to_sexpr
 from .text_and_documents import Generator, Version
 
 
@@ -425,29 +427,76 @@ class KicadSymbolLib(KiCadObject):
         metadata={"description": "List of symbol definitions", "required": False},
     )
 
+    @staticmethod
+    def _check_file_suffix(file_path: Union[str, Path]) -> None:
+        """Raise ValueError unless file_path is a .kicad_sym file."""
+        if Path(file_path).suffix != ".kicad_sym":
+            raise ValueError("Unsupported file extension. Expected: .kicad_sym")
+
     @classmethod
     def from_file(
         cls,
-        file_path: str,
+        file_path: Union[str, Path],
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> "KicadSymbolLib":
         """Parse from S-expression file - convenience method for symbol library operations."""
-        if not file_path.endswith(".kicad_sym"):
-            raise ValueError("Unsupported file extension. Expected: .kicad_sym")
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
+        cls._check_file_suffix(file_path)
+        content = read_sexpr_file(file_path, encoding)
         return cls.from_str(content, strictness)
 
-    def save_to_file(self, file_path: str, encoding: str = "utf-8") -> None:
+    @classmethod
+    def symbol_ids_from_file(
+        cls, file_path: Union[str, Path], encoding: str = "utf-8"
+    ) -> List[str]:
+        """List the library IDs of all symbols in a .kicad_sym file.
+
+        The whole file is parsed to S-expressions, but no symbol objects are
+        created.
+        """
+        return [
+            str(symbol_sexpr[1]) if len(symbol_sexpr) > 1 else ""
+            for symbol_sexpr in cls._read_symbol_sexprs(file_path, encoding)
+        ]
+
+    @classmethod
+    def symbol_from_file(
+        cls,
+        file_path: Union[str, Path],
+        library_id: str,
+        strictness: ParseStrictness = ParseStrictness.STRICT,
+        encoding: str = "utf-8",
+    ) -> Optional[Symbol]:
+        """Parse a single symbol from a .kicad_sym file.
+
+        The whole file is parsed to S-expressions, but only the requested
+        symbol is converted to objects. Returns None if the symbol does not exist.
+        """
+        for symbol_sexpr in cls._read_symbol_sexprs(file_path, encoding):
+            if len(symbol_sexpr) > 1 and str(symbol_sexpr[1]) == library_id:
+                return Symbol.from_sexpr(symbol_sexpr, strictness)
+        return None
+
+    @classmethod
+    def _read_symbol_sexprs(
+        cls, file_path: Union[str, Path], encoding: str
+    ) -> List[Any]:
+        """Read the raw S-expressions of all top-level symbols in a file."""
+        cls._check_file_suffix(file_path)
+        # The returned lists are only read, so the cached tree is shared
+        sexpr = str_to_sexpr(read_sexpr_file(file_path, encoding), copy=False)
+        cls._check_token(sexpr, [cls.__name__])
+        return SExprParser(sexpr).get_list_of_tokens("symbol")
+
+    def save_to_file(
+        self, file_path: Union[str, Path], encoding: str = "utf-8"
+    ) -> None:
         """Save to .kicad_sym file format.
 
         Args:
             file_path: Path to write the .kicad_sym file
             encoding: File encoding (default: utf-8)
         """
-        if not file_path.endswith(".kicad_sym"):
-            raise ValueError("Unsupported file extension. Expected: .kicad_sym")
+        self._check_file_suffix(file_path)
         content = self.to_sexpr_str(pretty_print=True)
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        Path(file_path).write_text(content, encoding=encoding)
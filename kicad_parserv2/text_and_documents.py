@@ -1,10 +1,12 @@
 """Text and document related elements for KiCad S-expressions."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Optional, Union
 
 from .base_element import KiCadObject, ParseStrictness
 from .base_types import At, Font, Id, Locked, Name, Pos, Size, Uuid, Xyz
+from .sexpr_parser import read_sexpr_file
 
 
 @dataclass
@@ -593,29 +595,29 @@ class KicadWks(KiCadObject):
     @classmethod
     def from_file(
         cls,
-        file_path: str,
+        file_path: Union[str, Path],
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> "KicadWks":
         """Parse from S-expression file - convenience method for worksheet operations."""
-        if not file_path.endswith(".kicad_wks"):
+        if Path(file_path).suffix != ".kicad_wks":
             raise ValueError("Unsupported file extension. Expected: .kicad_wks")
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
+        content = read_sexpr_file(file_path, encoding)
         return cls.from_str(content, strictness)
 
-    def save_to_file(self, file_path: str, encoding: str = "utf-8") -> None:
+    def save_to_file(
+        self, file_path: Union[str, Path], encoding: str = "utf-8"
+    ) -> None:
         """Save to .kicad_wks file format.
 
         Args:
             file_path: Path to write the .kicad_wks file
             encoding: File encoding (default: utf-8)
         """
-        if not file_path.endswith(".kicad_wks"):
+        if Path(file_path).suffix != ".kicad_wks":
             raise ValueError("Unsupported file extension. Expected: .kicad_wks")
         content = self.to_sexpr_str(pretty_print=True)
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        Path(file_path).write_text(content, encoding=encoding)
 
 
 # Image related elements
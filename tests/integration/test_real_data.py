@@ -2,6 +2,7 @@
 Integration tests with real KiCad data files
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -53,10 +54,16 @@ class TestRealDataFiles:
         if not real_data_dir.exists():
             pytest.skip("Real test data directory not available")
 
-        # Test all .kicad_sym files
-        for file_path in real_data_dir.glob("*.kicad_sym"):
-            result = validate_kicad_file(file_path)
+        symbol_files = list(real_data_dir.glob("*.kicad_sym"))
+        footprint_files = list(real_data_dir.glob("*.kicad_mod"))
 
+        # Files are validated independently, so parse them in parallel
+        with ProcessPoolExecutor() as executor:
+            symbol_results = list(executor.map(validate_kicad_file, symbol_files))
+            footprint_results = list(executor.map(validate_kicad_file, footprint_files))
+
+        # Test all .kicad_sym files
+        for file_path, result in zip(symbol_files, symbol_results):
             assert (
                 result["valid"] is True
             ), f"File {file_path.name} failed validation: {result['error']}"
@@ -64,9 +71,7 @@ class TestRealDataFiles:
             assert result["object_type"] == "KiCadSymbolLibrary"
 
         # Test all .kicad_mod files
-        for file_path in real_data_dir.glob("*.kicad_mod"):
-            result = validate_kicad_file(file_path)
-
+        for file_path, result in zip(footprint_files, footprint_results):
             assert (
                 result["valid"] is True
             ), f"File {file_path.name} failed validation: {result['error']}"
@@ -80,9 +85,7 @@ class TestRealDataFiles:
 
         # Test symbol library files
         for file_path in real_data_dir.glob("*.kicad_sym"):
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
+            content = file_path.read_text(encoding="utf-8")
             file_type = detect_file_type(content)
             assert (
                 file_type == "symbol_library"
@@ -90,9 +93,7 @@ class TestRealDataFiles:
 
         # Test footprint files
         for file_path in real_data_dir.glob("*.kicad_mod"):
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
+            content = file_path.read_text(encoding="utf-8")
             file_type = detect_file_type(content)
             assert file_type == "footprint", f"Wrong type detected for {file_path.name}"
 
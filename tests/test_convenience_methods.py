@@ -4,9 +4,12 @@ import os
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from kicad_parserv2.base_element import ParseStrictness
 from kicad_parserv2.base_types import Layer
 from kicad_parserv2.board_layout import KicadPcb
+from kicad_parserv2.symbol_library import KicadSymbolLib
 
 
 def test_from_str_convenience_method():
@@ -138,9 +141,51 @@ def test_convenience_methods_integration():
         os.unlink(tmp_file_path)
 
 
+def test_symbol_from_file():
+    """Test reading single symbols from a symbol library file."""
+    file_path = "examples/test_data/small.kicad_sym"
+
+    symbol_ids = KicadSymbolLib.symbol_ids_from_file(file_path)
+    assert symbol_ids == ["LP5018RSMR"]
+
+    symbol = KicadSymbolLib.symbol_from_file(
+        file_path, "LP5018RSMR", ParseStrictness.LENIENT
+    )
+    library = KicadSymbolLib.from_file(file_path, ParseStrictness.LENIENT)
+    assert symbol == library.symbols[0]
+
+    assert KicadSymbolLib.symbol_from_file(file_path, "missing") is None
+
+
+def test_symbol_from_file_checks_file(tmp_path):
+    """Test that single-symbol reads check the extension and root token."""
+    with pytest.raises(ValueError, match="Unsupported file extension"):
+        KicadSymbolLib.symbol_ids_from_file(tmp_path / "library.kicad_mod")
+
+    path = tmp_path / "footprint.kicad_sym"
+    path.write_text('(footprint "R_0603")', encoding="utf-8")
+    with pytest.raises(ValueError, match="Token mismatch at KicadSymbolLib"):
+        KicadSymbolLib.symbol_from_file(path, "R_0603")
+
+
+def test_file_methods_accept_path_objects(tmp_path):
+    """Test from_file and save_to_file with pathlib.Path arguments."""
+    library = KicadSymbolLib.from_file(
+        Path("examples/test_data/small.kicad_sym"), ParseStrictness.LENIENT
+    )
+
+    output_path = tmp_path / "output.kicad_sym"
+    library.save_to_file(output_path)
+    assert KicadSymbolLib.from_file(output_path, ParseStrictness.LENIENT) == library
+
+    with pytest.raises(ValueError, match="Unsupported file extension"):
+        library.save_to_file(tmp_path / "output.kicad_sym.bak")
+
+
 if __name__ == "__main__":
     test_from_str_convenience_method()
     test_from_file_with_strictness()
     test_from_str_error_handling()
     test_convenience_methods_integration()
+    test_symbol_from_file()
     print("🎯 All convenience method tests passed!")
@@ -6,14 +6,29 @@ the round-trip (parse -> serialize) produces identical output to the original.
 
 import json
 import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import pytest
 
+from kicad_parserv2.json_base_element import JsonObject
 from kicad_parserv2.project_settings import KicadProject
 
 
+@dataclass
+class _Child(JsonObject):
+    value: int = 0
+
+
+@dataclass
+class _Parent(JsonObject):
+    """Uses string annotations, as with `from __future__ import annotations`."""
+
+    child: "Optional[_Child]" = None
+    children: "List[_Child]" = field(default_factory=list)
+
+
 def load_original_file(file_path: str) -> Dict[str, Any]:
     """Load original JSON file and return parsed data."""
     with open(file_path, "r", encoding="utf-8") as f:
@@ -241,6 +256,42 @@ def test_project_creation_with_defaults():
     assert default_class.priority == 2147483647
 
 
+def test_field_plan_resolves_string_annotations():
+    """Test that nested objects are parsed for string annotations too."""
+    parent = _Parent.from_dict({"child": {"value": 1}, "children": [{"value": 2}]})
+
+    assert isinstance(parent.child, _Child) and parent.child.value == 1
+    assert [child.value for child in parent.children] == [2]
+    assert parent.to_dict(preserve_original=False) == {
+        "child": {"value": 1},
+        "children": [{"value": 2}],
+    }
+    assert [name for name, _, _, _ in _Child._get_field_plan()] == ["value"]
+
+
+def test_field_plan_unresolvable_string_annotations():
+    """Test that unresolvable string annotations fall back to the raw type."""
+
+    @dataclass
+    class LocalChild(JsonObject):
+        value: int = 0
+
+    @dataclass
+    class LocalParent(JsonObject):
+        child: "Optional[LocalChild]" = None
+        count: int = 0
+
+    parent = LocalParent.from_dict({"child": {"value": 1}, "count": 2})
+
+    # The forward reference cannot be resolved, so the value stays as-is
+    assert parent.child == {"value": 1}
+    assert parent.count == 2
+    assert [field_type for _, field_type, _, _ in LocalParent._get_field_plan()] == [
+        "Optional[LocalChild]",
+        int,
+    ]
+
+
 def test_error_handling_invalid_file():
     """Test error handling for invalid files."""
     with pytest.raises(FileNotFoundError):
@@ -12,9 +12,12 @@ This test systematically tests all aspects of KiCadObject:
 """
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import pytest
+
 from kicad_parserv2 import ParseStrictness
 from kicad_parserv2.base_element import KiCadObject
 
@@ -304,6 +307,205 @@ def test_error_cases():
     print("✅ Error cases: PASSED")
 
 
+@dataclass
+class ExtendedValue(SimpleValue):
+    """Subclass adding a field to an already used class."""
+
+    unit: str = field(default="mm")
+
+
+def test_subclass_field_classification():
+    """Test that subclasses do not inherit the parent's cached field info."""
+    assert [info.name for info in SimpleValue._classify_fields()] == ["value"]
+    assert [info.name for info in ExtendedValue._classify_fields()] == [
+        "value",
+        "unit",
+    ]
+    assert ExtendedValue._get_field_defaults() == {"value": 0, "unit": "mm"}
+    registry = KiCadObject._registry
+    assert registry.index(SimpleValue) < registry.index(ExtendedValue)
+
+    obj = ExtendedValue.from_sexpr("(version 3 (unit inch))")
+    assert obj.value == 3
+    assert obj.unit == "inch"
+
+
+@dataclass
+class BuiltTokenValue(KiCadObject):
+    """Object whose token name is not a source literal."""
+
+    __token_name__ = "_".join(["built", "token"])
+    value: int = field(default=0)
+
+
+def test_token_names_interned():
+    """Test that token names are interned like the reader's symbol names."""
+    assert BuiltTokenValue.__token_name__ is sys.intern("built_token")
+    assert "__token_name__" not in ExtendedValue.__dict__
+    assert BuiltTokenValue.from_sexpr("(built_token (value 4))").value == 4
+
+
+@dataclass
+class RequiredValue(KiCadObject):
+    """Object with a field that has no default."""
+
+    __token_name__ = "required"
+    value: MultiValue
+
+
+def test_generated_to_sexpr():
+    """Test the per-class generated serializers."""
+    container = ListContainer(
+        name="box",
+        items=[SimpleValue(value=1), SimpleValue(value=2)],
+        positions=[MultiValue(x=1.0, y=2.0)],
+    )
+    assert container.to_sexpr() == [
+        "container",
+        ["name", "box"],
+        ["version", ["value", 1]],
+        ["version", ["value", 2]],
+        ["xy", ["x", 1.0], ["y", 2.0]],
+    ]
+    assert ExtendedValue(value=3, unit="inch").to_sexpr() == [
+        "version",
+        ["value", 3],
+        ["unit", "inch"],
+    ]
+    assert SimpleValue(value=3).to_sexpr() == ["version", ["value", 3]]
+    # Subclass instances are not the annotated type but still serialize
+    mixed = ListContainer(name="box", items=[SimpleValue(value=1), ExtendedValue()])
+    assert mixed.to_sexpr()[2:] == [
+        ["version", ["value", 1]],
+        ["version", ["value", 0], ["unit", "mm"]],
+    ]
+    nested = NestedObject(position=MultiValue(x=1.0, y=2.0))
+    assert nested.to_sexpr() == [
+        "nested",
+        ["name", "test"],
+        ["xy", ["x", 1.0], ["y", 2.0]],
+    ]
+    assert SimpleValue.__dict__["_to_sexpr_impl"] is not (
+        ExtendedValue.__dict__["_to_sexpr_impl"]
+    )
+
+    assert RequiredValue(value=MultiValue()).to_sexpr() == [
+        "required",
+        ["xy", ["x", 0.0], ["y", 0.0]],
+    ]
+    try:
+        RequiredValue(value=None).to_sexpr()
+        assert False, "Should have failed on required None field"
+    except ValueError as e:
+        assert "Required field 'value' is None in RequiredValue" in str(e)
+
+
+def test_positional_primitive_paths():
+    """Test typed positional atoms, conversions and named field precedence."""
+    obj = TripleValue.from_sexpr("(at 1.5 2 (angle 90))", ParseStrictness.COMPLETE)
+    assert (obj.x, obj.y, obj.angle) == (1.5, 2.0, 90.0)
+    assert [type(value) for value in (obj.x, obj.y, obj.angle)] == [float] * 3
+
+    obj = ComplexObject.from_sexpr(
+        "(complex 1.5 (another_required 7) (optional_field x))",
+        ParseStrictness.COMPLETE,
+    )
+    assert (obj.required_field, obj.optional_field, obj.another_required) == (
+        1.5,
+        "x",
+        7,
+    )
+
+
+@dataclass
+class CheckedValue(SimpleValue):
+    """Subclass whose __post_init__ must still run for parsed objects."""
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.value = abs(self.value)
+
+
+class InitValue(SimpleValue):
+    """Subclass whose own __init__ must still run for parsed objects."""
+
+    def __init__(self, value: int = 0) -> None:
+        super().__init__(value=value)
+        self.doubled = value * 2
+
+
+@dataclass
+class FactoryDefault(KiCadObject):
+    """Required object field filled by a default factory when missing."""
+
+    __token_name__ = "factory"
+    position: MultiValue = field(default_factory=lambda: MultiValue(x=1.0))
+
+
+def test_parsed_object_construction():
+    """Test that parsed objects match constructed ones."""
+    obj = ListContainer.from_sexpr("(container (name a) (version 1) (xy 2 3))")
+    assert obj == ListContainer(
+        name="a", items=[SimpleValue(value=1)], positions=[MultiValue(x=2, y=3)]
+    )
+    assert type(obj) is ListContainer
+
+    assert CheckedValue.from_sexpr("(version -5)").value == 5
+    assert InitValue.from_sexpr("(version 3)").doubled == 6
+    obj = FactoryDefault.from_sexpr("(factory)", ParseStrictness.PERMISSIVE)
+    assert obj.position == MultiValue(x=1.0)
+
+
+@dataclass
+class NumberLists(KiCadObject):
+    """Object with lists of primitive numbers."""
+
+    __token_name__ = "numbers"
+    ints: List[int] = field(default_factory=list)
+    floats: List[float] = field(default_factory=list)
+
+
+def test_primitive_number_lists():
+    """Test numeric list conversion and its error message."""
+    obj = NumberLists.from_sexpr("(numbers (ints 1 2 3) (floats 1 2.5))")
+    assert obj.ints == [1, 2, 3]
+    assert obj.floats == [1.0, 2.5]
+    assert type(obj.floats[0]) is float
+
+    try:
+        NumberLists.from_sexpr("(numbers (ints 1 x 3))")
+        assert False, "Should have failed on type conversion"
+    except ValueError as e:
+        assert "Cannot convert 'x' to int" in str(e)
+
+
+@dataclass
+class BoolValue(KiCadObject):
+    """Single bool value like (flag yes)."""
+
+    __token_name__ = "flag"
+    value: bool = field(default=False)
+
+
+BOOL_CASES = [
+    ("yes", True),
+    ("YES", True),
+    ("True", True),
+    ("1", True),
+    ("no", False),
+    ("No", False),
+    ("false", False),
+    ("0", False),
+    ("maybe", False),
+]
+
+
+@pytest.mark.parametrize("text, expected", BOOL_CASES)
+def test_bool_conversion(text, expected):
+    """Test the accepted spellings of bool values."""
+    assert BoolValue.from_sexpr(f"(flag {text})").value is expected
+
+
 def run_comprehensive_test():
     """Run all tests to find KiCadObject problems."""
     print("=== COMPREHENSIVE KiCadObject TEST ===")
@@ -320,6 +522,11 @@ def run_comprehensive_test():
     test_list_container()
     test_strictness_levels()
     test_error_cases()
+    test_subclass_field_classification()
+    test_generated_to_sexpr()
+    test_primitive_number_lists()
+    for text, expected in BOOL_CASES:
+        test_bool_conversion(text, expected)
 
     print("\n=== TEST SUMMARY ===")
     print("✅ Basic functionality works")
@@ -2,7 +2,7 @@
 
 import pytest
 
-from kicad_parserv2.base_element import ParseStrictness
+from kicad_parserv2.base_element import ParseCursor, ParseStrictness
 from kicad_parserv2.base_types import At, Layer, Size
 from kicad_parserv2.pad_and_drill import Pad
 from kicad_parserv2.sexpr_parser import SExprParser
@@ -78,6 +78,39 @@ def test_sexpr_parser_check_complete_usage_failure():
         parser.check_complete_usage("At")
 
 
+def test_sexpr_parser_check_complete_usage_token_only():
+    """Test that an expression without parameters is always complete."""
+    SExprParser(["pad"], track_usage=True).check_complete_usage()
+    SExprParser([], track_usage=True).check_complete_usage()
+
+
+def test_sexpr_parser_get_list_of_tokens():
+    """Test token lookup by name and its effect on usage tracking."""
+    sexpr_data = ["pad", "1", ["at", 0.0, 0.0], ["layer", "F.Cu"], ["layer", "B.Cu"]]
+    parser = SExprParser(sexpr_data, track_usage=True)
+
+    layers = parser.get_list_of_tokens("layer")
+    assert layers == [["layer", "F.Cu"], ["layer", "B.Cu"]]
+    assert parser.get_list_of_tokens("missing") == []
+
+    # Returned tokens count as used, everything else is still reported
+    assert parser.get_unused_parameters() == ["1", ["at", 0.0, 0.0]]
+
+
+def test_parse_cursor_token_index():
+    """Test that the cursor maps child token names to their indices."""
+    sexpr_data = ["pad", "1", ["at", 0.0, 0.0], "smd", ["layer", "F.Cu"], ["layer"]]
+    cursor = ParseCursor(
+        sexpr=sexpr_data, parser=SExprParser(sexpr_data), path=[], token_index={}
+    )
+    cursor.index_tokens()
+
+    assert cursor.find_tokens("at") == [2]
+    assert cursor.find_tokens("layer") == [4, 5]
+    assert cursor.find_tokens("pad") == []
+    assert cursor.find_tokens("smd") == []
+
+
 def test_complete_strictness_mode_with_fully_used_parameters():
     """Test COMPLETE strictness mode when all parameters are used."""
     # Simple At object S-expression: (at 10.0 20.0 90.0)
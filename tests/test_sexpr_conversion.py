@@ -0,0 +1,204 @@
+"""Tests for converting between strings and S-expressions."""
+
+import sys
+
+import pytest
+
+from kicad_parserv2.sexpdata import Quoted, Symbol, dumps
+from kicad_parserv2.sexpr_parser import (
+    clear_sexpr_cache,
+    read_sexpr_file,
+    sexpr_to_str,
+    str_to_sexpr,
+)
+
+
+def test_str_to_sexpr_repeated_parse_is_independent():
+    """Test that repeated parses of the same content do not share lists."""
+    content = "(footprint (at 1 2) (layer F.Cu))"
+
+    first = str_to_sexpr(content)
+    second = str_to_sexpr(content)
+    assert first == second
+
+    # Modifying one result must not leak into the next parse
+    first.append(["extra"])
+    first[1].append(90)
+    third = str_to_sexpr(content)
+    assert third == second
+    assert len(third) == 3
+    assert len(third[1]) == 3
+
+
+def test_str_to_sexpr_shared_result():
+    """Test that copy=False returns the cached tree until the cache is cleared."""
+    content = "(footprint (at 3 4))"
+
+    shared = str_to_sexpr(content, copy=False)
+    assert str_to_sexpr(content, copy=False) is shared
+    assert str_to_sexpr(content) == shared
+    assert str_to_sexpr(content) is not shared
+
+    clear_sexpr_cache()
+    assert str_to_sexpr(content, copy=False) is not shared
+
+
+def test_str_to_sexpr_large_content_not_cached():
+    """Test that large content is parsed on every call instead of cached."""
+    content = "(footprint" + " (at 1 2)" * 10000 + ")"
+
+    shared = str_to_sexpr(content, copy=False)
+    assert str_to_sexpr(content, copy=False) is not shared
+    assert str_to_sexpr(content, copy=False) == shared
+
+
+def test_str_to_sexpr_invalid_content():
+    """Test that invalid content raises ValueError."""
+    with pytest.raises(ValueError, match="Failed to parse S-expression"):
+        str_to_sexpr("(unclosed (token)")
+
+
+def test_str_to_sexpr_atoms_and_strings():
+    """Test classification of atoms, escapes and comments."""
+    sexpr = str_to_sexpr(
+        '(pad "1" smd (at -1.5 2) (net 3 "GND\\"x") ; trailing comment\n'
+        '  (descr "multi\nline") [a b])'
+    )
+
+    assert str(sexpr[0]) == "pad"
+    assert sexpr[1] == "1"
+    assert str(sexpr[2]) == "smd"
+    assert sexpr[3][1:] == [-1.5, 2]
+    assert isinstance(sexpr[3][2], int)
+    assert sexpr[4][1:] == [3, 'GND"x']
+    assert sexpr[5][1] == "multi\nline"
+    assert [str(item) for item in sexpr[6].I] == ["a", "b"]
+
+
+def test_str_to_sexpr_number_classification():
+    """Test that only well-formed finite numbers become int or float."""
+    sexpr = str_to_sexpr("(a 1 -2 +3 .5 1e3 -1.5e-3 inf -inf nan e5 - + 0x10)")
+
+    assert sexpr[1:7] == [1, -2, 3, 0.5, 1000.0, -0.0015]
+    assert [type(item) for item in sexpr[1:4]] == [int, int, int]
+    assert not any(isinstance(item, (int, float)) for item in sexpr[7:])
+    assert [str(item) for item in sexpr[7:]] == [
+        "inf",
+        "-inf",
+        "nan",
+        "e5",
+        "-",
+        "+",
+        "0x10",
+    ]
+
+
+def test_str_to_sexpr_escaped_whitespace_numbers():
+    """Test that numbers after an escaped space are still numbers."""
+    sexpr = str_to_sexpr(r"(a \ 1 \ -2.5 \ x)")
+
+    assert sexpr[1:3] == [1, -2.5]
+    assert isinstance(sexpr[1], int)
+    assert sexpr[3] == Symbol(" x")
+
+
+def test_str_to_sexpr_symbols_have_no_position():
+    """Test that the reader does not record positions for symbols."""
+    sexpr = str_to_sexpr("(a b (c d))")
+
+    assert sexpr[1] == Symbol("b")
+    assert sexpr[1].position is None
+    assert sexpr[2][1].position is None
+
+
+def test_str_to_sexpr_shares_repeated_values():
+    """Test that equal strings, symbols and numbers are shared within one parse."""
+    sexpr = str_to_sexpr('(a (layer "F.Cu") (layer "F.Cu") (w 1000.5 1000.5 1000.50))')
+
+    assert sexpr[1][1] is sexpr[2][1]
+    assert sexpr[3][1] is sexpr[3][2]
+    assert sexpr[3][3] == 1000.5
+    assert sexpr[1][0] is sexpr[2][0]
+    assert sexpr[1][0] == Symbol("layer")
+
+
+def test_str_to_sexpr_nil_lists_are_distinct():
+    """Test that each nil becomes its own empty list."""
+    sexpr = str_to_sexpr("(a nil nil)")
+
+    assert sexpr[1:] == [[], []]
+    assert sexpr[1] is not sexpr[2]
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("(a (b)", "Not enough closing brackets"),
+        ("(a))", "Too many closing brackets"),
+        ('(a "open)', "Unterminated string literal"),
+        ("(a ')", "No s-exp is found after an apostrophe"),
+    ],
+)
+def test_str_to_sexpr_errors_report_position(content, message):
+    """Test that malformed content raises errors with a source position."""
+    with pytest.raises(ValueError, match=f"{message}.* at line 1, column"):
+        str_to_sexpr(content)
+
+
+def test_read_sexpr_file_matches_text_mode(tmp_path):
+    """Test that files read like text mode, including line endings."""
+    path = tmp_path / "test.kicad_sym"
+    path.write_bytes('(a "Ω\r\nx"\r\n (b 1)\r)'.encode("utf-8"))
+
+    with open(path, "r", encoding="utf-8") as f:
+        expected = f.read()
+    assert read_sexpr_file(str(path)) == expected
+    assert str_to_sexpr(read_sexpr_file(str(path)))[1] == "Ω\nx"
+
+
+def test_read_sexpr_file_empty(tmp_path):
+    """Test that empty files are read as empty strings."""
+    path = tmp_path / "empty.kicad_sym"
+    path.write_bytes(b"")
+    assert read_sexpr_file(str(path)) == ""
+
+
+@pytest.mark.parametrize("pretty_print", [True, False])
+@pytest.mark.parametrize(
+    "sexpr",
+    [
+        [],
+        ["at", 1, 2.5],
+        ["symbol", ["pin", ["at", 0, 0], "hide"], [], True, False, None],
+        [Symbol("a b"), 'x "y"\n\t', [Symbol("c"), -0.0, 10**20]],
+        # Cached number texts must keep 0.0/-0.0 and 1/1.0/True apart
+        ["xy", 0.0, -0.0, 0.0, 1.0, 1, True, 1.0, -256, -257, 1023, 1024],
+        # Not handled by the fast writer, passed on to sexpdata
+        [Symbol("a"), ("t", 1), Quoted(Symbol("b"))],
+        [Symbol("a"), ["b", "line\x0bbreak"]],
+    ],
+)
+def test_sexpr_to_str_matches_dumps(sexpr, pretty_print):
+    """Test that serialization gives exactly the sexpdata output."""
+    expected = dumps(sexpr, pretty_print=pretty_print)
+    assert sexpr_to_str(sexpr, pretty_print=pretty_print) == expected
+
+
+def test_sexpr_to_str_file_round_trip():
+    """Test that a parsed file serializes like sexpdata serializes it."""
+    sexpr = str_to_sexpr(read_sexpr_file("examples/test_data/small.kicad_sym"))
+    for pretty_print in (True, False):
+        expected = dumps(sexpr, pretty_print=pretty_print)
+        assert sexpr_to_str(sexpr, pretty_print=pretty_print) == expected
+
+
+def test_sexpr_to_str_deep_nesting():
+    """Test that serialization does not depend on the recursion limit."""
+    depth = sys.getrecursionlimit() + 100
+    sexpr = [1]
+    for _ in range(depth):
+        sexpr = ["a", sexpr]
+
+    flat = sexpr_to_str(sexpr, pretty_print=False)
+    assert flat == '("a" ' * depth + "(1)" + ")" * depth
+    assert sexpr_to_str(sexpr).endswith("\n  )\n)")
@@ -37,6 +37,17 @@ class TestFileTypeDetection:
         file_type = detect_file_type(content)
         assert file_type == "unknown"
 
+    def test_detect_root_token_only(self):
+        """Test that detection only looks at the root token"""
+        content = '\n  ( footprint "R_0603" (layer F.Cu)'
+        file_type = detect_file_type(content)
+        assert file_type == "footprint"
+
+    def test_detect_truncated_content(self):
+        """Test that truncated content is detected by its root token"""
+        # The rest of the content is not parsed; loading it still fails
+        assert detect_file_type("(kicad_pcb (version 20221018)") == "board"
+
     def test_detect_invalid_content(self):
         """Test detecting invalid content"""
         content = "not valid s-expression"
@@ -63,6 +63,26 @@ class TestKiCadSymbol:
         assert ref_prop.key == "Reference"
         assert ref_prop.value == "U"
 
+    def test_get_property_after_direct_changes(self):
+        """Test property lookup after modifying the properties list directly"""
+        ref_prop = SymbolProperty("Reference", "U", 0, Position(0, 0))
+        value_prop = SymbolProperty("Value", "LM358", 1, Position(0, 0))
+        symbol = KiCadSymbol(name="LM358", properties=[ref_prop, value_prop])
+
+        # Rename in place, the old key must no longer be found
+        ref_prop.key = "Designator"
+        assert symbol.get_property("Reference") is None
+        assert symbol.get_property("Designator") is ref_prop
+
+        # Replace the list entry
+        new_prop = SymbolProperty("Designator", "IC", 0, Position(0, 0))
+        symbol.properties[0] = new_prop
+        assert symbol.get_property("Designator") is new_prop
+
+        # With duplicate keys the first property in the list wins
+        new_prop.key = "Value"
+        assert symbol.get_property("Value") is new_prop
+
     def test_set_property_existing(self, sample_symbol):
         """Test setting existing property"""
         sample_symbol.set_property("Reference", "IC")